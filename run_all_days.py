@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 
+import argparse
+import contextlib
 import importlib
+import io
 import os
 import sys
+import time
 
-def run_day(day_number):
+def run_day(day_number, use_cache=True):
     """
     Run a specific day's solution.
     
     Args:
         day_number (int): The day number to run (1-25)
+        use_cache (bool): Reuse answers stored by earlier runs
     """
     try:
         # Construct the module name
@@ -19,28 +24,316 @@ def run_day(day_number):
         day_module = importlib.import_module(module_name)
         
         # Print day header
-        print(f"\n{'='*20}")
-        print(f"Day {day_number}")
-        print(f"{'='*20}")
+        print(_day_header(day_number), end='')
         
-        # Run the main function
-        day_module.main()
+        if use_cache:
+            solve_with_cache(day_number, day_module)
+        else:
+            # Run the main function
+            day_module.main()
     
     except ImportError:
         print(f"No solution found for Day {day_number}")
     except Exception as e:
         print(f"Error running Day {day_number}: {e}")
 
-def main():
+def solve_with_cache(day_number, day_module):
+    """
+    Print a day's answers, computing only the parts missing from the answer cache.
+
+    Answers are keyed by the input file's hash and the day module's source
+    hash, so editing either one recomputes the day.
+    """
+    from src.answer_cache import AnswerCache
+    from src.loader import day_input_path, file_digest, load_input, module_digest
+
+    cache = AnswerCache()
+    input_hash = file_digest(day_input_path(day_module.__file__))
+    source_hash = module_digest(day_module)
+    input_data = None
+
+    for part in (1, 2):
+        key = cache.key(day_number, part, input_hash, source_hash)
+        hit, answer = cache.get(key)
+        if not hit:
+            if input_data is None:
+                input_data = load_input(day_module.__file__, day_module.parse_input)
+            answer = getattr(day_module, f"part{part}")(input_data)
+            cache.put(key, answer, day=day_number, part=part)
+        print(f"Part {part}:", answer)
+
+def _day_worker(day_number, conn, use_cache=True):
+    """
+    Run a day inside a worker process and send its captured output back.
+
+    Args:
+        day_number (int): The day number to run (1-25)
+        conn: Write end of a pipe to the parent process
+        use_cache (bool): Reuse answers stored by earlier runs
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        run_day(day_number, use_cache)
+    conn.send(buffer.getvalue())
+    conn.close()
+
+def _day_header(day_number):
+    """Return the banner run_day prints before a day's output."""
+    return f"\n{'='*20}\nDay {day_number}\n{'='*20}\n"
+
+def run_days_parallel(days, jobs, timeout=None, use_cache=True):
+    """
+    Run days in separate worker processes, at most `jobs` at a time.
+
+    Each day gets its own process, so a crash or hang cannot affect the
+    others. A day still running after `timeout` seconds is terminated.
+    Output is printed in day order as soon as every earlier day is done.
+
+    Args:
+        days (list): Distinct day numbers to run
+        jobs (int): Maximum number of concurrent worker processes
+        timeout (float): Per-day wall-clock limit in seconds, or None
+        use_cache (bool): Reuse answers stored by earlier runs
+
+    Returns:
+        dict: Day number to captured output
+    """
+    import multiprocessing
+
+    context = multiprocessing.get_context()
+    pending = list(days)
+    running = {}
+    outputs = {}
+    next_to_print = 0
+
+    while pending or running:
+        # Start workers until the pool is full
+        while pending and len(running) < jobs:
+            day = pending.pop(0)
+            reader, writer = context.Pipe(duplex=False)
+            process = context.Process(target=_day_worker, args=(day, writer, use_cache), daemon=True)
+            process.start()
+            writer.close()
+            running[day] = (process, reader, time.monotonic())
+
+        # Collect finished or timed-out workers
+        for day, (process, reader, started) in list(running.items()):
+            # Check liveness before polling: a worker sends its output before it
+            # exits, so one found dead here has nothing more to send after the poll
+            alive = process.is_alive()
+            output = None
+            if reader.poll():
+                try:
+                    output = reader.recv()
+                except EOFError:
+                    pass
+            elif alive:
+                if timeout is None or time.monotonic() - started <= timeout:
+                    continue
+                process.terminate()
+                output = f"{_day_header(day)}Timed out after {timeout:g}s\n"
+            process.join()
+            reader.close()
+            if output is None:
+                output = f"{_day_header(day)}Error running Day {day}: worker exited with code {process.exitcode}\n"
+            outputs[day] = output
+            del running[day]
+
+        # Print results in day order
+        while next_to_print < len(days) and days[next_to_print] in outputs:
+            sys.stdout.write(outputs[days[next_to_print]])
+            sys.stdout.flush()
+            next_to_print += 1
+
+        if running:
+            time.sleep(0.01)
+
+    return outputs
+
+def run_stream(day_number, source, jobs=1):
+    """
+    Stream an input through a day's solve_stream and print both answers.
+
+    Days with a solve_file (day 3) scan a named file memory-mapped in
+    `jobs` processes instead, so they cannot read stdin.
+
+    Returns:
+        int: Process exit code, 1 if the day cannot stream this source
+    """
+    from src.loader import iter_lines
+
+    day_module = importlib.import_module(f"src.day_{day_number:02d}.day_{day_number:02d}")
+    if hasattr(day_module, 'solve_file') and source != '-':
+        part1, part2 = day_module.solve_file(source, jobs=jobs)
+    elif hasattr(day_module, 'solve_stream'):
+        part1, part2 = day_module.solve_stream(iter_lines(source))
+    elif hasattr(day_module, 'solve_file'):
+        print(f"Day {day_number} needs --input FILE (mmap scan)")
+        return 1
+    else:
+        print(f"Day {day_number} has no streaming mode")
+        return 1
+    print("Part 1:", part1)
+    print("Part 2:", part2)
+    return 0
+
+def run_bench(days, args):
+    """
+    Benchmark the selected days and check them against a baseline.
+
+    Returns:
+        int: Process exit code, 1 if any phase regressed
+    """
+    from src import benchmark
+
+    if args.sweep:
+        return run_sweep(days, args)
+
+    results = benchmark.run_benchmarks(days, args.warmup, args.repeat, memory=args.memory)
+    benchmark.write_results(results, args.bench_output)
+    print(f"Results written to {args.bench_output}")
+
+    if not args.baseline:
+        return 0
+    if args.update_baseline or not os.path.exists(args.baseline):
+        benchmark.write_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = benchmark.compare_to_baseline(
+        results, benchmark.read_results(args.baseline), args.threshold, days=days
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        return 1
+    print(f"No regressions against {args.baseline}")
+    return 0
+
+def run_sweep(days, args):
+    """
+    Time the selected days on generated inputs of several sizes.
+
+    Returns:
+        int: Process exit code
+    """
+    import tempfile
+
+    from src import benchmark
+    from src.input_generators import GENERATORS
+
+    scales = [int(scale) for scale in args.sweep.split(',')]
+    results = {'seed': args.seed, 'scales': scales, 'sweep': {}}
+    with tempfile.TemporaryDirectory(prefix='aoc_sweep_') as directory:
+        for day in days:
+            if day not in GENERATORS:
+                continue
+            sweep = benchmark.sweep_day(day, scales, directory, args.warmup, args.repeat, args.seed)
+            results['sweep'][str(day)] = sweep
+            print(benchmark.format_sweep(day, sweep))
+    benchmark.write_results(results, args.bench_output)
+    print(f"Results written to {args.bench_output}")
+    return 0
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2024 solutions.")
+    parser.add_argument('days', nargs='*', type=int,
+                        help="Days to run (default: 1-25)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Run days in N worker processes (default: 1, in-process)")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Per-day wall-clock limit in seconds (runs each day in a worker process)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Recompute every answer and re-parse every input")
+    parser.add_argument('--telemetry', choices=('stderr', 'json'), default=None,
+                        help="Report progress and throughput of long loops to stderr")
+
+    stream = parser.add_argument_group('streaming')
+    stream.add_argument('--stream', type=int, metavar='DAY', default=None,
+                        help="Solve DAY in one bounded-memory pass over --input "
+                             "(days 1, 2, 5, 7; day 3 needs --input FILE)")
+    stream.add_argument('--input', default='-',
+                        help="Input file for --stream, '-' for stdin (default: -)")
+
+    startup = parser.add_argument_group('import time')
+    startup.add_argument('--import-times', action='store_true',
+                         help="Report each day module's import cost (python -X importtime)")
+    startup.add_argument('--import-budget', type=float, default=50.0,
+                         help="Per-day import budget in ms; exit 1 if exceeded (default: 50)")
+
+    profile = parser.add_argument_group('profiling')
+    profile.add_argument('--profile', type=int, metavar='DAY', default=None,
+                         help="Profile DAY's part1/part2 with cProfile and a stack sampler")
+    profile.add_argument('--profile-dir', default='profiles',
+                         help="Where to write .pstats and .folded files (default: profiles)")
+    profile.add_argument('--top', type=int, default=15,
+                         help="Number of hot functions to print (default: 15)")
+
+    bench = parser.add_argument_group('benchmarking')
+    bench.add_argument('--bench', action='store_true',
+                       help="Time parse_input, part1 and part2 instead of printing answers")
+    bench.add_argument('--warmup', type=int, default=1,
+                       help="Untimed calls before measuring each phase (default: 1)")
+    bench.add_argument('--repeat', type=int, default=5,
+                       help="Timed calls per phase (default: 5)")
+    bench.add_argument('--memory', action='store_true',
+                       help="Also record tracemalloc peak memory and allocations per phase")
+    bench.add_argument('--sweep', default=None, metavar='SCALES',
+                       help="Comma-separated input scale factors (e.g. 1,10,100); time days 1-9 "
+                            "on generated inputs of those sizes instead of input.txt")
+    bench.add_argument('--seed', type=int, default=2024,
+                       help="Seed for generated sweep inputs (default: 2024)")
+    bench.add_argument('--bench-output', default='bench_results.json',
+                       help="Where to write benchmark JSON (default: bench_results.json)")
+    bench.add_argument('--baseline', default=None,
+                       help="Baseline JSON to compare against; exit 1 on regression")
+    bench.add_argument('--threshold', type=float, default=0.2,
+                       help="Allowed relative slowdown before a phase counts as regressed (default: 0.2)")
+    bench.add_argument('--update-baseline', action='store_true',
+                       help="Also write the results to the --baseline file")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
     # Get the directory of the script
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    
+
     # Add the base directory to Python path
     sys.path.insert(0, base_dir)
-    
-    # Run all days from 1 to 25
-    for day in range(1, 26):
-        run_day(day)
+
+    # Bypass the parsed-input and answer caches, including in worker processes
+    if args.no_cache:
+        os.environ['AOC_NO_CACHE'] = '1'
+    # Likewise switch on progress reports (see src/telemetry.py)
+    if args.telemetry:
+        os.environ['AOC_TELEMETRY'] = args.telemetry
+
+    # Run the selected days (all days from 1 to 25 by default), each once
+    days = list(dict.fromkeys(args.days)) or list(range(1, 26))
+    if args.stream is not None:
+        return run_stream(args.stream, args.input, args.jobs)
+    if args.import_times:
+        from src.import_times import report_import_times
+
+        over_budget = report_import_times(days, args.import_budget, cwd=base_dir)
+        return 1 if over_budget else 0
+    if args.profile is not None:
+        from src.profiling import profile_day
+
+        for path in profile_day(args.profile, args.profile_dir, args.top):
+            print(f"Wrote {path}")
+        return 0
+    if args.bench:
+        return run_bench(days, args)
+    # A timeout needs a worker process to terminate, even with one job
+    if args.jobs > 1 or args.timeout is not None:
+        run_days_parallel(days, args.jobs, args.timeout, not args.no_cache)
+    else:
+        for day in days:
+            run_day(day, not args.no_cache)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
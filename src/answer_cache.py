@@ -0,0 +1,93 @@
+"""Persistent store of computed answers, keyed by input and solution source."""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from src.loader import CACHE_DIR
+
+class AnswerCache:
+    """
+    On-disk answer store with least-recently-used eviction.
+
+    Each entry is a small JSON file named after its key, so concurrent worker
+    processes can read and write the store without coordinating. A hit
+    refreshes the entry's modification time; when the store grows past
+    `max_entries` files or `max_bytes` in total, the entries with the oldest
+    modification time are removed first.
+    """
+
+    def __init__(self, directory=None, max_entries=512, max_bytes=1 << 20):
+        self.directory = directory or CACHE_DIR / 'answers'
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(day, part, input_hash, source_hash):
+        """Build the cache key for one part of one day."""
+        return hashlib.sha256(f"{day}:{part}:{input_hash}:{source_hash}".encode()).hexdigest()
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        """
+        Look up an answer.
+
+        Returns:
+            tuple: (True, answer) on a hit, (False, None) on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r') as file:
+                entry = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return False, None
+        return True, entry['answer']
+
+    def put(self, key, answer, **metadata):
+        """Store an answer, then evict old entries if the store is over its limits."""
+        try:
+            payload = json.dumps(dict(metadata, answer=answer))
+        except TypeError:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as file:
+                file.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            os.unlink(tmp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the store is within its limits."""
+        entries = []
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            total -= size
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every stored answer."""
+        for path in self.directory.glob('*.json'):
+            path.unlink()
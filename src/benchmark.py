@@ -0,0 +1,286 @@
+"""Benchmark harness timing parse_input, part1 and part2 of each day separately."""
+
+import contextlib
+import importlib
+import io
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+
+from src.loader import day_input_path
+
+PHASES = ('parse_input', 'part1', 'part2')
+
+def load_day(day_number):
+    """Import and return the solution module for a day."""
+    return importlib.import_module(f"src.day_{day_number:02d}.day_{day_number:02d}")
+
+def percentile(samples, fraction):
+    """Return the nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    rank = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[rank]
+
+def summarize(samples):
+    """Reduce timing samples (in seconds) to summary statistics."""
+    return {
+        'repeat': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 0.95),
+        'mean': statistics.fmean(samples),
+    }
+
+def time_call(func, args, warmup=1, repeat=5):
+    """
+    Time repeated calls of func(*args).
+
+    Output printed by the call is discarded so it does not skew timings.
+
+    Args:
+        func (callable): Function to time
+        args (tuple): Positional arguments for the call
+        warmup (int): Untimed calls made first
+        repeat (int): Timed calls
+
+    Returns:
+        tuple: (last return value, list of durations in seconds)
+    """
+    samples = []
+    result = None
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        for i in range(warmup + repeat):
+            start = time.perf_counter()
+            result = func(*args)
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                samples.append(elapsed)
+            sink.seek(0)
+            sink.truncate()
+    return result, samples
+
+def measure_memory(func, args):
+    """
+    Call func(*args) once under tracemalloc.
+
+    Tracing slows the call down considerably, so this is a separate pass
+    from the timed calls.
+
+    Returns:
+        dict: 'peak_bytes' (highest memory allocated by the call at any
+        point), 'net_bytes' and 'net_blocks' (memory and number of
+        allocations the call left behind, including its return value)
+    """
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        # A trace started right before the call only sees the call's own
+        # allocations, so its peak and what is still traced afterwards need no
+        # baseline snapshot, nor tracemalloc.reset_peak (Python 3.9+)
+        tracemalloc.start()
+        try:
+            result = func(*args)
+            net_bytes, peak = tracemalloc.get_traced_memory()
+            net_blocks = len(tracemalloc.take_snapshot().traces)
+        finally:
+            tracemalloc.stop()
+
+    memory = {
+        'peak_bytes': peak,
+        'net_bytes': net_bytes,
+        'net_blocks': net_blocks,
+    }
+    del result
+    return memory
+
+def benchmark_day(day_number, warmup=1, repeat=5, memory=False):
+    """
+    Benchmark one day's parse_input, part1 and part2.
+
+    Args:
+        memory (bool): Also record tracemalloc statistics for each phase
+
+    Returns:
+        dict: Phase name to timing summary, plus the answers produced
+    """
+    day_module = load_day(day_number)
+    input_path = day_input_path(day_module.__file__)
+
+    input_data, samples = time_call(day_module.parse_input, (input_path,), warmup, repeat)
+    result = {'parse_input': summarize(samples)}
+    if memory:
+        result['parse_input'].update(measure_memory(day_module.parse_input, (input_path,)))
+    answers = {}
+    for part in ('part1', 'part2'):
+        func = getattr(day_module, part)
+        answers[part], samples = time_call(func, (input_data,), warmup, repeat)
+        result[part] = summarize(samples)
+        if memory:
+            result[part].update(measure_memory(func, (input_data,)))
+    result['answers'] = answers
+    return result
+
+def run_benchmarks(days, warmup=1, repeat=5, report=print, memory=False):
+    """
+    Benchmark several days.
+
+    Days without a solution module or that raise are recorded with an error
+    instead of aborting the whole run.
+
+    Returns:
+        dict: JSON-serializable results keyed by day number
+    """
+    results = {
+        'python': platform.python_version(),
+        'warmup': warmup,
+        'repeat': repeat,
+        'memory': memory,
+        'days': {},
+    }
+    for day in days:
+        try:
+            entry = benchmark_day(day, warmup, repeat, memory)
+        except ImportError:
+            continue
+        except Exception as e:
+            entry = {'error': f"{type(e).__name__}: {e}"}
+        results['days'][str(day)] = entry
+        if report:
+            report(format_day(day, entry))
+    return results
+
+def format_day(day_number, entry):
+    """Format one day's benchmark entry as a table row."""
+    if 'error' in entry:
+        return f"Day {day_number:2d}  error: {entry['error']}"
+    cells = []
+    for phase in PHASES:
+        stats = entry[phase]
+        cell = f"{phase} {stats['median'] * 1000:10.3f}ms (p95 {stats['p95'] * 1000:.3f})"
+        if 'peak_bytes' in stats:
+            cell += f" peak {stats['peak_bytes'] / 1024:.0f}KiB/{stats['net_blocks']} blocks"
+        cells.append(cell)
+    return f"Day {day_number:2d}  " + "  ".join(cells)
+
+def sweep_day(day_number, scales, directory, warmup=0, repeat=1, seed=2024):
+    """
+    Time a day's phases on generated inputs of increasing size.
+
+    Args:
+        scales (list): Size multipliers passed to the input generator
+        directory (str): Where the generated inputs are written
+
+    Returns:
+        dict: Scale (as a string) to input size in bytes and phase timings
+    """
+    from src.input_generators import write_input
+
+    day_module = load_day(day_number)
+    sweep = {}
+    for scale in scales:
+        input_path = write_input(day_number, scale, directory, seed)
+        input_data, samples = time_call(day_module.parse_input, (input_path,), warmup, repeat)
+        entry = {'bytes': input_path.stat().st_size, 'parse_input': summarize(samples)}
+        for part in ('part1', 'part2'):
+            _, samples = time_call(getattr(day_module, part), (input_data,), warmup, repeat)
+            entry[part] = summarize(samples)
+        sweep[str(scale)] = entry
+    return sweep
+
+def scaling_exponent(sweep, phase):
+    """
+    Estimate k in time ~ size**k from the smallest and largest sweep points.
+
+    Returns None when the timings are too small to compare meaningfully.
+    """
+    points = sorted((entry['bytes'], entry[phase]['median']) for entry in sweep.values())
+    (small_size, small_time), (large_size, large_time) = points[0], points[-1]
+    if large_size == small_size or small_time < 1e-5 or large_time < 1e-5:
+        return None
+    return math.log(large_time / small_time) / math.log(large_size / small_size)
+
+def format_sweep(day_number, sweep, width=40):
+    """
+    Plot time against input size as text, one bar per scale and phase.
+
+    Bars are on a log scale relative to the slowest phase of the sweep, so
+    linear growth shows as evenly spaced bar lengths.
+    """
+    slowest = max(entry[phase]['median'] for entry in sweep.values() for phase in PHASES)
+    fastest = min(max(entry[phase]['median'], 1e-6) for entry in sweep.values() for phase in PHASES)
+    span = math.log(slowest / fastest) if slowest > fastest else 1.0
+    lines = [f"Day {day_number} time vs input size (log scale)"]
+    for phase in PHASES:
+        exponent = scaling_exponent(sweep, phase)
+        growth = f"~size^{exponent:.2f}" if exponent is not None else "too fast to fit"
+        lines.append(f"  {phase} ({growth})")
+        for scale, entry in sorted(sweep.items(), key=lambda item: int(item[0])):
+            median = max(entry[phase]['median'], 1e-6)
+            bar = '#' * max(1, round(width * math.log(median / fastest) / span)) if median > fastest else '|'
+            lines.append(f"    x{scale:<6} {entry['bytes']:>12,}B {median * 1000:12.3f}ms {bar}")
+    return '\n'.join(lines)
+
+def write_results(results, path):
+    """Write benchmark results to a JSON file."""
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+def read_results(path):
+    """Read benchmark results from a JSON file."""
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def compare_to_baseline(results, baseline, threshold=0.2, min_delta=0.001, min_bytes=65536, days=None):
+    """
+    Find phases whose median time or peak memory regressed against a baseline.
+
+    A phase regresses when its median exceeds the baseline median by more
+    than `threshold` (relative) and by more than `min_delta` seconds, so
+    sub-millisecond noise on fast days is ignored. Peak memory is compared
+    the same way, with `min_bytes` as the absolute floor, when both runs
+    recorded it. A day that worked in the baseline but now fails, or is
+    missing from the results, is a regression too.
+
+    Args:
+        days (list): Day numbers that were benchmarked; baseline days outside
+            them are not expected in the results. Defaults to every baseline day.
+
+    Returns:
+        list: Human-readable regression descriptions
+    """
+    base_days = baseline.get('days', {})
+    expected = set(base_days) if days is None else {str(day) for day in days}
+    regressions = []
+    for day in sorted(set(results['days']) | set(base_days), key=int):
+        entry = results['days'].get(day)
+        base_entry = base_days.get(day)
+        if not base_entry or 'error' in base_entry:
+            continue
+        if entry is None:
+            if day in expected:
+                regressions.append(f"Day {day}: missing from the results")
+            continue
+        if 'error' in entry:
+            regressions.append(f"Day {day}: {entry['error']}")
+            continue
+        for phase in PHASES:
+            current = entry[phase]['median']
+            previous = base_entry[phase]['median']
+            if current > previous * (1 + threshold) and current - previous > min_delta:
+                growth = f"+{(current / previous - 1) * 100:.0f}%" if previous else "new cost"
+                regressions.append(
+                    f"Day {day} {phase}: {previous * 1000:.3f}ms -> {current * 1000:.3f}ms ({growth})"
+                )
+            if 'peak_bytes' not in entry[phase] or 'peak_bytes' not in base_entry[phase]:
+                continue
+            current = entry[phase]['peak_bytes']
+            previous = base_entry[phase]['peak_bytes']
+            if current > previous * (1 + threshold) and current - previous > min_bytes:
+                growth = f"+{(current / previous - 1) * 100:.0f}%" if previous else "new cost"
+                regressions.append(
+                    f"Day {day} {phase} peak memory: {previous / 1024:.0f}KiB -> {current / 1024:.0f}KiB ({growth})"
+                )
+    return regressions
@@ -1,6 +1,8 @@
-from pathlib import Path
+from bisect import bisect_left, bisect_right
 from collections import Counter
 
+from src.loader import load_input
+
 def parse_input(input_path):
     """Parse the input file into left and right lists."""
     with open(input_path, 'r') as file:
@@ -13,6 +15,12 @@ def parse_input(input_path):
             right_list.append(int(right))
         return left_list, right_list
 
+def parse_lines(lines):
+    """Yield (left, right) location id pairs from an iterable of lines."""
+    for line in lines:
+        left, right = line.split()
+        yield int(left), int(right)
+
 def part1(input_data):
     """
     Calculate total distance between lists by pairing sorted numbers
@@ -44,9 +52,376 @@ def part2(input_data):
     
     return similarity_score
 
+def parse_input_np(input_path):
+    """
+    Parse the input file into left and right NumPy int64 arrays.
+
+    The whole file is read by a single np.loadtxt call, whose C parser
+    replaces the Python loop over lines.
+    """
+    import numpy as np
+    
+    pairs = np.loadtxt(input_path, dtype=np.int64, ndmin=2)
+    if pairs.shape[1] != 2:
+        raise ValueError("Each line must hold exactly two location ids")
+    return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+def part1_np(input_data):
+    """Vectorized part 1: sort both arrays and sum their absolute differences."""
+    import numpy as np
+    
+    left, right = input_data
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+def part2_np(input_data):
+    """
+    Vectorized part 2: join left ids against the distinct right ids.
+
+    np.unique gives the sorted distinct right ids with their counts, and
+    np.searchsorted finds each left id's slot in them, so no Python-level
+    loop or Counter is needed.
+    """
+    import numpy as np
+    
+    left, right = input_data
+    if not len(left) or not len(right):
+        return 0
+    values, counts = np.unique(right, return_counts=True)
+    slots = np.searchsorted(values, left).clip(max=len(values) - 1)
+    matched = values[slots] == left
+    return int((left[matched] * counts[slots[matched]]).sum())
+
+def paired_distance(left_counts, right_counts):
+    """
+    Total distance between two equally long lists given as value -> count maps.
+
+    Walking both maps in sorted order pairs the i-th smallest values exactly
+    as sorting the full lists would, using memory proportional to the number
+    of distinct values only.
+    """
+    left_items = iter(sorted(left_counts.items()))
+    right_items = iter(sorted(right_counts.items()))
+    total = 0
+    left_value, left_count = next(left_items, (0, 0))
+    right_value, right_count = next(right_items, (0, 0))
+    while left_count and right_count:
+        paired = min(left_count, right_count)
+        total += paired * abs(left_value - right_value)
+        left_count -= paired
+        right_count -= paired
+        if not left_count:
+            left_value, left_count = next(left_items, (0, 0))
+        if not right_count:
+            right_value, right_count = next(right_items, (0, 0))
+    return total
+
+def solve_stream(lines):
+    """
+    Solve both parts in one pass over an iterable of lines.
+
+    Only a count per distinct location id is kept, so memory stays bounded
+    by the id range however many pairs are streamed.
+    """
+    left_counts = Counter()
+    right_counts = Counter()
+    for left, right in parse_lines(lines):
+        left_counts[left] += 1
+        right_counts[right] += 1
+    
+    total_distance = paired_distance(left_counts, right_counts)
+    similarity_score = sum(num * count * right_counts[num] for num, count in left_counts.items())
+    return total_distance, similarity_score
+
+class _Block:
+    """
+    A run of consecutive distinct ids of a LocationLists.
+
+    For each id it keeps the difference on the segment starting there,
+    stored without the block's lazy offset, and the segment's length.
+    `histogram` maps stored values to their total length, `negative` is the
+    length whose difference is < 0 and `total` the length of all segments.
+    """
+
+    __slots__ = ('ids', 'values', 'weights', 'lazy', 'histogram', 'negative', 'total')
+
+    def __init__(self, ids, values, weights, lazy=0):
+        self.ids = ids
+        self.values = values
+        self.weights = weights
+        self.lazy = lazy
+        self.histogram = {}
+        self.negative = 0
+        self.total = 0
+        for value, weight in zip(values, weights):
+            self._count(value, weight)
+
+    def _count(self, value, weight):
+        """Add weight (may be negative) to the totals of a stored value."""
+        self.histogram[value] = self.histogram.get(value, 0) + weight
+        self.total += weight
+        if value + self.lazy < 0:
+            self.negative += weight
+
+    def insert(self, position, point, difference, weight):
+        value = difference - self.lazy
+        self.ids.insert(position, point)
+        self.values.insert(position, value)
+        self.weights.insert(position, weight)
+        self._count(value, weight)
+
+    def pop(self, position):
+        self._count(self.values[position], -self.weights[position])
+        del self.ids[position], self.values[position], self.weights[position]
+
+    def set_weight(self, position, weight):
+        self._count(self.values[position], weight - self.weights[position])
+        self.weights[position] = weight
+
+    def difference(self, position):
+        return self.values[position] + self.lazy
+
+    def unpacked(self):
+        """Return (ids, differences, weights) with the lazy offset applied."""
+        return self.ids, [value + self.lazy for value in self.values], self.weights
+
+class LocationLists:
+    """
+    Left and right location lists that keep both answers current as pairs change.
+
+    Similarity is kept as a running sum: adding or removing a left id x
+    changes it by x times the count of x on the right, and vice versa, so
+    both updates are O(1) with two Counters.
+
+    For the distance, pairing the i-th smallest ids of two equally long lists
+    gives the same total as summing |#left <= x  -  #right <= x| over every
+    integer x. That difference only changes at ids present in the lists, so
+    it is stored once per distinct id for the segment up to the next one,
+    weighted by the segment's length. Inserting the pair (l, r) adds +1 to
+    the difference on [l, r) (or -1 on [r, l)), and the distance changes by
+    the length where it was >= 0 minus the length where it was < 0
+    (mirrored for -1). The distinct ids are kept as a blocked sorted list,
+    each block with a lazy offset and a length-weighted histogram of its
+    values, so a whole block is updated in O(1). A pair update costs
+    O(block_size + d / block_size) for d distinct ids, and memory is O(d),
+    however large or far apart the ids are. Ids must be integers.
+    """
+
+    def __init__(self, pairs=(), block_size=64):
+        self.block_size = block_size
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.distance = 0
+        self.similarity = 0
+        self._size = 0
+        self._blocks = []
+        # First id of every block, for bisecting to the right block
+        self._firsts = []
+        self.extend(pairs)
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, pairs):
+        """Insert every (left, right) pair from an iterable."""
+        if not self._size:
+            self._build(pairs)
+            return
+        for left, right in pairs:
+            self.insert(left, right)
+
+    def _build(self, pairs):
+        """Fill empty lists in one O(n log n) pass instead of n inserts."""
+        for left, right in pairs:
+            self.left_counts[left] += 1
+            self.right_counts[right] += 1
+            self._size += 1
+        points = sorted(self.left_counts.keys() | self.right_counts.keys())
+        differences = []
+        difference = 0
+        for point in points:
+            difference += self.left_counts[point] - self.right_counts[point]
+            differences.append(difference)
+        weights = [following - point for point, following in zip(points, points[1:])] + [0]
+        self.distance = sum(weight * abs(difference) for weight, difference in zip(weights, differences))
+        self.similarity = sum(point * count * self.right_counts[point]
+                              for point, count in self.left_counts.items())
+        for start in range(0, len(points), self.block_size):
+            stop = start + self.block_size
+            self._blocks.append(_Block(points[start:stop], differences[start:stop], weights[start:stop]))
+            self._firsts.append(points[start])
+
+    def insert(self, left, right):
+        """Add one pair of location ids."""
+        self.similarity += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity += right * self.left_counts[right]
+        self.right_counts[right] += 1
+        self._size += 1
+        self._add_point(left)
+        self._add_point(right)
+        if left < right:
+            self._add(left, right, 1)
+        elif right < left:
+            self._add(right, left, -1)
+
+    def remove(self, left, right):
+        """Remove one left id and one right id (not necessarily inserted together)."""
+        if not self.left_counts[left] or not self.right_counts[right]:
+            raise KeyError(f"({left}, {right}) is not in the lists")
+        self.right_counts[right] -= 1
+        self.similarity -= right * self.left_counts[right]
+        self.left_counts[left] -= 1
+        self.similarity -= left * self.right_counts[left]
+        self._size -= 1
+        if left < right:
+            self._add(left, right, -1)
+        elif right < left:
+            self._add(right, left, 1)
+        for point in {left, right}:
+            if not self.left_counts[point] and not self.right_counts[point]:
+                del self.left_counts[point], self.right_counts[point]
+                self._remove_point(point)
+
+    def _locate(self, point):
+        """Return (block index, position) where point is or would be inserted."""
+        block_index = max(0, bisect_right(self._firsts, point) - 1)
+        return block_index, bisect_left(self._blocks[block_index].ids, point)
+
+    def _next_id(self, block_index, position):
+        """Return the id after (block_index, position - 1), or None at the end."""
+        block = self._blocks[block_index]
+        if position < len(block.ids):
+            return block.ids[position]
+        if block_index + 1 < len(self._blocks):
+            return self._firsts[block_index + 1]
+        return None
+
+    def _add_point(self, point):
+        """Start a new segment at point, splitting the segment that covered it."""
+        if not self._blocks:
+            # Beyond the last id the lists are balanced: difference 0, length unused
+            self._blocks.append(_Block([point], [0], [0]))
+            self._firsts.append(point)
+            return
+        block_index, position = self._locate(point)
+        block = self._blocks[block_index]
+        if position < len(block.ids) and block.ids[position] == point:
+            return
+        following = self._next_id(block_index, position)
+        weight = following - point if following is not None else 0
+        if position == 0:
+            # Before the first id nothing is counted yet
+            difference = 0
+            self._firsts[0] = point
+        else:
+            # The new segment takes over the difference of the one it splits
+            difference = block.difference(position - 1)
+            block.set_weight(position - 1, point - block.ids[position - 1])
+        block.insert(position, point, difference, weight)
+        if len(block.ids) > 2 * self.block_size:
+            self._split(block_index)
+
+    def _remove_point(self, point):
+        """Merge the segment starting at point, no longer a present id, into the previous one."""
+        block_index, position = self._locate(point)
+        block = self._blocks[block_index]
+        following = self._next_id(block_index, position + 1)
+        if position > 0:
+            previous_block, previous = block, position - 1
+        elif block_index > 0:
+            previous_block = self._blocks[block_index - 1]
+            previous = len(previous_block.ids) - 1
+        else:
+            previous_block = None
+        if previous_block is not None:
+            start = previous_block.ids[previous]
+            previous_block.set_weight(previous, following - start if following is not None else 0)
+        block.pop(position)
+        if not block.ids:
+            del self._blocks[block_index], self._firsts[block_index]
+            return
+        self._firsts[block_index] = block.ids[0]
+        if len(block.ids) < self.block_size // 4 and block_index + 1 < len(self._blocks):
+            self._merge(block_index)
+
+    def _split(self, block_index):
+        ids, differences, weights = self._blocks[block_index].unpacked()
+        half = len(ids) // 2
+        self._blocks[block_index:block_index + 1] = [
+            _Block(ids[:half], differences[:half], weights[:half]),
+            _Block(ids[half:], differences[half:], weights[half:]),
+        ]
+        self._firsts.insert(block_index + 1, ids[half])
+
+    def _merge(self, block_index):
+        first, second = self._blocks[block_index], self._blocks[block_index + 1]
+        parts = list(zip(first.unpacked(), second.unpacked()))
+        self._blocks[block_index:block_index + 2] = [_Block(*(a + b for a, b in parts))]
+        del self._firsts[block_index + 1]
+        if len(self._blocks[block_index].ids) > 2 * self.block_size:
+            self._split(block_index)
+
+    def _add(self, start, stop, delta):
+        """Add delta (+1 or -1) to the difference on [start, stop) and update the distance."""
+        first_block, first = self._locate(start)
+        last_block, last = self._locate(stop)
+        if first_block == last_block:
+            self._add_partial(self._blocks[first_block], first, last, delta)
+            return
+        block = self._blocks[first_block]
+        self._add_partial(block, first, len(block.ids), delta)
+        
+        # Whole blocks in between only move their lazy offset
+        distance = self.distance
+        for block in self._blocks[first_block + 1:last_block]:
+            lazy = block.lazy
+            negative = block.negative
+            if delta > 0:
+                # Lengths at >= 0 grow by one, lengths at < 0 shrink by one
+                distance += block.total - 2 * negative
+                # Lengths at -1 reach 0
+                block.negative = negative - block.histogram.get(-lazy - 1, 0)
+            else:
+                # Lengths at <= 0 grow by one, lengths at > 0 shrink by one
+                at_or_below_zero = negative + block.histogram.get(-lazy, 0)
+                distance += 2 * at_or_below_zero - block.total
+                # Lengths at 0 drop to -1
+                block.negative = at_or_below_zero
+            block.lazy = lazy + delta
+        self.distance = distance
+        
+        self._add_partial(self._blocks[last_block], 0, last, delta)
+
+    def _add_partial(self, block, low, high, delta):
+        values = block.values
+        weights = block.weights
+        histogram = block.histogram
+        # Stored values that are zero, or the first one below zero, once offset
+        zero = -block.lazy
+        flips = zero - 1 if delta > 0 else zero
+        # Values at or past this one move away from zero, growing the distance
+        away = zero if delta > 0 else -zero
+        change = 0
+        negative = 0
+        for i in range(low, high):
+            value = values[i]
+            weight = weights[i]
+            if value * delta >= away:
+                change += weight
+            else:
+                change -= weight
+            if value == flips:
+                negative += weight
+            histogram[value] -= weight
+            values[i] = value = value + delta
+            histogram[value] = histogram.get(value, 0) + weight
+        self.distance += change
+        # +1 lifts -1 to 0, -1 drops 0 to -1
+        block.negative += -negative if delta > 0 else negative
+
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
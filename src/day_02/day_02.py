@@ -1,9 +1,14 @@
-from pathlib import Path
+from src.loader import load_input
 
 def parse_input(input_path):
     """Parse the input file for the day's challenge."""
     with open(input_path, 'r') as file:
-        return [list(map(int, line.split())) for line in file.readlines()]
+        return list(parse_lines(file))
+
+def parse_lines(lines):
+    """Yield reports as lists of levels from an iterable of lines."""
+    for line in lines:
+        yield list(map(int, line.split()))
 
 def is_safe_report(report):
     """
@@ -19,25 +24,119 @@ def is_safe_report(report):
     
     return increasing or decreasing
 
+def find_violation(report, sign, skip=-1):
+    """
+    Return the index of the first level whose step from the previous level is unsafe.
+
+    sign is 1 for an increasing report and -1 for a decreasing one. The level
+    at index skip is treated as removed. Returns -1 if every step is safe.
+    """
+    previous = None
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if previous is not None and not 0 < (level - previous) * sign <= 3:
+            return i
+        previous = level
+    return -1
+
 def is_safe_with_problem_dampener(report):
     """
-    Check if a report is safe by potentially removing one level
+    Check if a report is safe by potentially removing one level.
+
+    For each direction, the first unsafe step is between levels i-1 and i.
+    Removing any other level leaves that step in place, so only those two
+    removals are tried, which keeps the check O(n) with no list copies.
     """
-    # If already safe, return True
-    if is_safe_report(report):
-        return True
-    
-    # Try removing each level and check if the resulting report is safe
-    for i in range(len(report)):
-        # Create a new report without the i-th level
-        modified_report = report[:i] + report[i+1:]
-        
-        # Check if the modified report is safe
-        if is_safe_report(modified_report):
+    for sign in (1, -1):
+        i = find_violation(report, sign)
+        if i == -1:
+            return True
+        if find_violation(report, sign, skip=i - 1) == -1 or find_violation(report, sign, skip=i) == -1:
             return True
     
     return False
 
+def count_safe_batch(reports):
+    """
+    Count safe reports with and without the Problem Dampener using NumPy.
+
+    Reports are grouped by length into 2-D arrays and every safety check is
+    computed with array operations over the whole group at once.
+
+    Returns:
+        tuple: (number of safe reports, number safe with the Problem Dampener)
+    """
+    import numpy as np
+    
+    by_length = {}
+    for report in reports:
+        by_length.setdefault(len(report), []).append(report)
+    
+    safe_total = 0
+    dampened_total = 0
+    for length, group in by_length.items():
+        if length <= 2:
+            # Zero or one step left after removing a level is always safe
+            levels = np.array(group, dtype=np.int64).reshape(len(group), length)
+            steps = np.abs(np.diff(levels, axis=1))
+            safe = ((steps >= 1) & (steps <= 3)).all(axis=1)
+            safe_total += int(safe.sum())
+            dampened_total += len(group)
+            continue
+        safe, dampened = safe_masks(np.array(group, dtype=np.int64))
+        safe_total += int(safe.sum())
+        dampened_total += int(dampened.sum())
+    return safe_total, dampened_total
+
+def safe_masks(levels):
+    """
+    Compute safety masks for an (m, n) array of equally long reports, n >= 3.
+
+    Removing level k keeps steps 0..k-2 and k+1..n-2 and joins levels k-1
+    and k+1 with one new step. Prefix and suffix running "all steps safe"
+    masks answer the first two parts for every k at once.
+
+    Returns:
+        tuple: (safe mask, safe-with-dampener mask), boolean arrays of length m
+    """
+    import numpy as np
+    
+    m, n = levels.shape
+    safe = np.zeros(m, dtype=bool)
+    dampened = np.zeros(m, dtype=bool)
+    for sign in (1, -1):
+        steps = np.diff(levels, axis=1) * sign
+        ok = (steps >= 1) & (steps <= 3)
+        # prefix[:, j]: steps 0..j-1 are safe; suffix[:, j]: steps j..n-2 are safe
+        prefix = np.ones((m, n), dtype=bool)
+        prefix[:, 1:] = np.logical_and.accumulate(ok, axis=1)
+        suffix = np.ones((m, n), dtype=bool)
+        suffix[:, :-1] = np.logical_and.accumulate(ok[:, ::-1], axis=1)[:, ::-1]
+        
+        joined = (levels[:, 2:] - levels[:, :-2]) * sign
+        joined_ok = (joined >= 1) & (joined <= 3)
+        safe |= prefix[:, n - 1]
+        dampened |= (
+            prefix[:, n - 1]
+            | suffix[:, 1]  # remove the first level
+            | prefix[:, n - 2]  # remove the last level
+            | (prefix[:, :n - 2] & joined_ok & suffix[:, 2:]).any(axis=1)
+        )
+    return safe, dampened
+
+def solve_stream(lines):
+    """Solve both parts in one pass, holding a single report in memory at a time."""
+    safe = 0
+    safe_with_dampener = 0
+    for report in parse_lines(lines):
+        if is_safe_report(report):
+            safe += 1
+            safe_with_dampener += 1
+        elif is_safe_with_problem_dampener(report):
+            safe_with_dampener += 1
+    return safe, safe_with_dampener
+
 def part1(input_data):
     """Solve Part 1 of the challenge."""
     safe_reports = [report for report in input_data if is_safe_report(report)]
@@ -49,8 +148,8 @@ def part2(input_data):
     return len(safe_reports)
 
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
@@ -1,11 +1,19 @@
+import mmap
+import os
 import re
-from pathlib import Path
+
+from src.loader import load_input
 
 def parse_input(input_path):
     """Parse the input file and return the corrupted memory content."""
     with open(input_path, 'r') as file:
         return file.read().strip()
 
+MUL_PATTERN = re.compile(r'mul\((\d{1,3}),(\d{1,3})\)')
+
+# One alternation for every instruction, so part 2 is a single left-to-right scan
+INSTRUCTION_PATTERN = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|don't\(\)")
+
 def find_valid_multiplications(memory, handle_conditionals=False):
     """
     Find all valid mul(X,Y) instructions in the corrupted memory.
@@ -13,45 +21,113 @@ def find_valid_multiplications(memory, handle_conditionals=False):
     """
     if not handle_conditionals:
         # Part 1: Simple pattern matching
-        pattern = r'mul\((\d{1,3}),(\d{1,3})\)'
-        matches = re.finditer(pattern, memory)
+        matches = MUL_PATTERN.finditer(memory)
         return [int(x) * int(y) for x, y in (match.groups() for match in matches)]
     
-    # Part 2: Process instructions sequentially
+    # Part 2: Process instructions sequentially in one linear pass
     results = []
     enabled = True  # Initially enabled
-    pos = 0
     
-    while pos < len(memory):
-        # Check for do() instruction
-        if memory[pos:].startswith('do()'):
-            enabled = True
-            pos += 4
-            continue
-            
-        # Check for don't() instruction
-        if memory[pos:].startswith("don't()"):
-            enabled = False
-            pos += 7
-            continue
-        
-        # Check for mul instruction if enabled
-        if enabled and memory[pos:].startswith('mul('):
-            # Look for the closing parenthesis
-            end_pos = memory.find(')', pos)
-            if end_pos != -1:
-                instruction = memory[pos:end_pos+1]
-                match = re.match(r'mul\((\d{1,3}),(\d{1,3})\)', instruction)
-                if match:
-                    x, y = map(int, match.groups())
-                    results.append(x * y)
-                    pos = end_pos + 1
-                    continue
-        
-        pos += 1
+    for x, y, do in INSTRUCTION_PATTERN.findall(memory):
+        if x:
+            if enabled:
+                results.append(int(x) * int(y))
+        else:
+            # do() enables, don't() disables
+            enabled = bool(do)
     
     return results
 
+# Byte-level version of INSTRUCTION_PATTERN for scanning memory-mapped files
+BYTES_INSTRUCTION_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|don't\(\)")
+
+# Longest possible instruction, mul(123,456)
+MAX_INSTRUCTION_LENGTH = 12
+
+def scan_chunk(path, start, stop):
+    """
+    Scan the instructions that start in bytes [start, stop) of a file.
+
+    The file is memory-mapped, and the scan reads up to
+    MAX_INSTRUCTION_LENGTH - 1 bytes past stop so an instruction that
+    straddles the boundary belongs to the chunk it starts in. No instruction
+    can start inside another one, so starting a chunk mid-stream finds the
+    same matches as a scan from the beginning.
+
+    Returns:
+        tuple: (sum of all products, sum of enabled products if the chunk
+        starts enabled, the same if it starts disabled, the enabled state
+        after the chunk's last do()/don't(), or None if it has none)
+    """
+    total = 0
+    sums = {True: 0, False: 0}
+    final_state = None
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        end = min(len(memory), stop + MAX_INSTRUCTION_LENGTH - 1)
+        for match in BYTES_INSTRUCTION_PATTERN.finditer(memory, start, end):
+            if match.start() >= stop:
+                break
+            x, y, do = match.groups()
+            if x:
+                product = int(x) * int(y)
+                total += product
+                # Until the chunk's first toggle the state is the one it started with
+                if final_state is None:
+                    sums[True] += product
+                elif final_state:
+                    sums[True] += product
+                    sums[False] += product
+            else:
+                final_state = bool(do)
+    return total, sums[True], sums[False], final_state
+
+def combine_chunks(chunks):
+    """
+    Combine scan_chunk results, in file order, into both answers.
+
+    A prefix scan carries the enabled state from chunk to chunk and picks
+    each chunk's sum for the state it actually starts in.
+
+    Returns:
+        tuple: (part 1 answer, part 2 answer)
+    """
+    enabled = True
+    part1_total = 0
+    part2_total = 0
+    for total, if_enabled, if_disabled, final_state in chunks:
+        part1_total += total
+        part2_total += if_enabled if enabled else if_disabled
+        if final_state is not None:
+            enabled = final_state
+    return part1_total, part2_total
+
+def _scan_chunk_args(args):
+    return scan_chunk(*args)
+
+def solve_file(path, chunk_size=64 << 20, jobs=None):
+    """
+    Solve both parts for a (possibly multi-GB) file without reading it into memory.
+
+    The file is split into chunk_size byte ranges, which are scanned in a
+    process pool of `jobs` workers (os.cpu_count() by default; 1 scans in
+    this process) and combined with combine_chunks.
+
+    Returns:
+        tuple: (part 1 answer, part 2 answer)
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, 0
+    ranges = [(path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(ranges) == 1:
+        return combine_chunks(map(_scan_chunk_args, ranges))
+    
+    import multiprocessing
+    
+    with multiprocessing.Pool(min(jobs, len(ranges))) as pool:
+        return combine_chunks(pool.imap(_scan_chunk_args, ranges))
+
 def part1(input_data):
     """Find and sum all valid multiplication results."""
     multiplications = find_valid_multiplications(input_data)
@@ -63,8 +139,8 @@ def part2(input_data):
     return sum(multiplications)
 
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
@@ -1,90 +1,252 @@
-from pathlib import Path
+from src.grid import Grid
+from src.loader import load_input
+
+X, M, A, S = b'XMAS'
 
 def parse_input(input_path):
     """Parse the input file and return the word search grid."""
     with open(input_path, 'r') as file:
-        return [line.strip() for line in file.readlines() if line.strip()]
+        return Grid.from_lines(file)
 
-def check_mas(grid, row, col, dx, dy):
-    """Check if MAS exists starting from (row, col) in direction (dx, dy)."""
-    height = len(grid)
-    width = len(grid[0])
-    
-    # Check bounds
-    if not (0 <= row + 2*dx < height and 0 <= col + 2*dy < width):
-        return False
+def check_mas(grid, start, step):
+    """Check if MAS exists starting at cell index start, moving step cells at a time."""
+    cells = grid.cells
     
     # Check forwards (MAS)
-    forwards = (grid[row][col] == 'M' and
-               grid[row + dx][col + dy] == 'A' and
-               grid[row + 2*dx][col + 2*dy] == 'S')
+    forwards = (cells[start] == M and
+               cells[start + step] == A and
+               cells[start + 2*step] == S)
                
     # Check backwards (SAM)
-    backwards = (grid[row][col] == 'S' and
-                grid[row + dx][col + dy] == 'A' and
-                grid[row + 2*dx][col + 2*dy] == 'M')
+    backwards = (cells[start] == S and
+                cells[start + step] == A and
+                cells[start + 2*step] == M)
                 
     return forwards or backwards
 
 def find_xmas(grid):
     """Find all occurrences of XMAS in the grid in all directions."""
-    height = len(grid)
-    width = len(grid[0])
+    cells = grid.cells
     count = 0
     
-    # Direction vectors for all 8 possible directions
-    directions = [
-        (0, 1),   # right
-        (0, -1),  # left
-        (1, 0),   # down
-        (-1, 0),  # up
-        (1, 1),   # down-right
-        (-1, -1), # up-left
-        (1, -1),  # down-left
-        (-1, 1)   # up-right
-    ]
+    # Index offsets for all 8 possible directions
+    directions = grid.offsets8
     
-    def check_direction(row, col, dx, dy):
-        """Check if XMAS exists starting from (row, col) in direction (dx, dy)."""
-        if not (0 <= row + 3*dx < height and 0 <= col + 3*dy < width):
-            return False
-        
-        return (grid[row][col] == 'X' and
-                grid[row + dx][col + dy] == 'M' and
-                grid[row + 2*dx][col + 2*dy] == 'A' and
-                grid[row + 3*dx][col + 3*dy] == 'S')
+    def check_direction(index, step):
+        """Check if XMAS exists starting at index, moving step cells at a time."""
+        # A step off the grid reads the border sentinel, which never matches
+        return (cells[index + step] == M and
+                cells[index + 2*step] == A and
+                cells[index + 3*step] == S)
     
     # Check each starting position
-    for row in range(height):
-        for col in range(width):
-            # Try each direction from this position
-            for dx, dy in directions:
-                if check_direction(row, col, dx, dy):
-                    count += 1
+    for index in grid.indices():
+        if cells[index] != X:
+            continue
+        # Try each direction from this position
+        for step in directions:
+            if check_direction(index, step):
+                count += 1
     
     return count
 
 def find_x_mas(grid):
     """Find all X-shaped patterns with MAS on each diagonal."""
-    height = len(grid)
-    width = len(grid[0])
+    cells = grid.cells
+    stride = grid.stride
     count = 0
     
-    # For each possible center point of the X
-    for row in range(1, height - 1):  # Center needs space above and below
-        for col in range(1, width - 1):  # Center needs space left and right
-            # Check if we have MAS in both diagonals
-            # Top-left to bottom-right diagonal
-            tlbr = check_mas(grid, row - 1, col - 1, 1, 1)
-            # Top-right to bottom-left diagonal
-            trbl = check_mas(grid, row - 1, col + 1, 1, -1)
-            
-            # Both diagonals must contain MAS
-            if tlbr and trbl:
-                count += 1
+    # For each possible center point of the X; centers on the edge see the border
+    for index in grid.indices():
+        if cells[index] != A:
+            continue
+        # Check if we have MAS in both diagonals
+        # Top-left to bottom-right diagonal
+        tlbr = check_mas(grid, index - stride - 1, stride + 1)
+        # Top-right to bottom-left diagonal
+        trbl = check_mas(grid, index - stride + 1, stride - 1)
+        
+        # Both diagonals must contain MAS
+        if tlbr and trbl:
+            count += 1
     
     return count
 
+def grid_array(grid):
+    """Return the grid's cells without the border as a 2D NumPy uint8 array."""
+    import numpy as np
+    
+    array = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height + 2, grid.stride)
+    return array[1:-1, 1:-1]
+
+def count_word_np(array, word):
+    """
+    Count occurrences of word in all 8 directions of a uint8 grid array.
+
+    For each direction the word's letters are compared against shifted
+    slices of the array, one whole-array comparison per letter, and the
+    start cells where every comparison holds are counted. A word reading
+    the same both ways is counted once per direction, like find_xmas does.
+
+    Args:
+        array (numpy.ndarray): 2D uint8 array, e.g. from grid_array
+        word (str): Word to search for
+
+    Returns:
+        int: Number of (start cell, direction) matches
+    """
+    height, width = array.shape
+    letters = word.encode()
+    span = len(letters) - 1
+    count = 0
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            if dx == dy == 0:
+                continue
+            # Start cells from which the whole word stays inside the grid
+            y0, y1 = max(0, -dy * span), height - max(0, dy * span)
+            x0, x1 = max(0, -dx * span), width - max(0, dx * span)
+            if y0 >= y1 or x0 >= x1:
+                continue
+            found = None
+            for k, letter in enumerate(letters):
+                shifted = array[y0 + k*dy:y1 + k*dy, x0 + k*dx:x1 + k*dx] == letter
+                found = shifted if found is None else found & shifted
+            count += int(found.sum())
+    return count
+
+def count_x_np(array, word):
+    """
+    Count X shapes formed by an odd-length word crossing itself.
+
+    Both diagonals through a centre cell must read word forwards or
+    backwards, so count_x_np(array, "MAS") is the part 2 answer.
+
+    Args:
+        array (numpy.ndarray): 2D uint8 array, e.g. from grid_array
+        word (str): Word of odd length to search for
+
+    Returns:
+        int: Number of centre cells where the X matches
+    """
+    letters = word.encode()
+    if len(letters) % 2 == 0:
+        raise ValueError("The X pattern needs a word of odd length")
+    height, width = array.shape
+    radius = len(letters) // 2
+    if height <= 2 * radius or width <= 2 * radius:
+        return 0
+    
+    def diagonal(step):
+        """Cells along one diagonal through every centre, one slice per offset k."""
+        return [array[k:height - 2*radius + k,
+                      radius + step*(k - radius):width - radius + step*(k - radius)]
+                for k in range(len(letters))]
+    
+    def reads_word(cells):
+        forwards = backwards = True
+        for k, letter in enumerate(letters):
+            forwards = forwards & (cells[k] == letter)
+            backwards = backwards & (cells[-1 - k] == letter)
+        return forwards | backwards
+    
+    # Top-left to bottom-right, then top-right to bottom-left
+    return int((reads_word(diagonal(1)) & reads_word(diagonal(-1))).sum())
+
+def part1_np(grid):
+    """Vectorized part 1: count XMAS with shifted-slice comparisons."""
+    return count_word_np(grid_array(grid), "XMAS")
+
+def part2_np(grid):
+    """Vectorized part 2: count X-MAS patterns with boolean masks."""
+    return count_x_np(grid_array(grid), "MAS")
+
+class WordAutomaton:
+    """
+    Aho-Corasick automaton counting many words in one pass over a sequence.
+
+    The trie of all words is completed into a deterministic automaton, so
+    each byte costs one dict lookup however many words there are. Matches
+    are tallied per state during the scan and pushed to the words ending in
+    that state (including through failure links) only once at the end.
+    """
+
+    def __init__(self, words):
+        self.words = list(dict.fromkeys(words))
+        if not all(self.words):
+            raise ValueError("Words must not be empty")
+        
+        # Trie: transitions per state and the words ending exactly there
+        transitions = [{}]
+        ends = [[]]
+        for word_index, word in enumerate(self.words):
+            state = 0
+            for byte in word.encode():
+                if byte not in transitions[state]:
+                    transitions.append({})
+                    ends.append([])
+                    transitions[state][byte] = len(transitions) - 1
+                state = transitions[state][byte]
+            ends[state].append(word_index)
+        
+        # Breadth-first over the trie: a state's failure link is shallower,
+        # so its completed transitions are known before the state's own
+        fail = [0] * len(transitions)
+        self.order = []
+        queue = list(transitions[0].values())
+        for state in queue:
+            self.order.append(state)
+            for byte, child in transitions[state].items():
+                fail[child] = transitions[fail[state]].get(byte, 0)
+                queue.append(child)
+            transitions[state] = {**transitions[fail[state]], **transitions[state]}
+        self.transitions = transitions
+        self.fail = fail
+        self.ends = ends
+
+    def scan(self, data, visits):
+        """Run the automaton over a bytes-like sequence, counting visits per state."""
+        transitions = self.transitions
+        state = 0
+        for byte in data:
+            state = transitions[state].get(byte, 0)
+            visits[state] += 1
+
+    def counts(self, visits):
+        """Turn per-state visit counts into a {word: count} dict."""
+        visits = list(visits)
+        counts = dict.fromkeys(self.words, 0)
+        # Deepest states first, so each state's total includes its suffixes' matches
+        for state in reversed(self.order):
+            for word_index in self.ends[state]:
+                counts[self.words[word_index]] += visits[state]
+            visits[self.fail[state]] += visits[state]
+        return counts
+
+    def count_in_grid(self, grid):
+        """
+        Count every word in all 8 directions of a Grid.
+
+        The Grid's sentinel border separates consecutive lines in the flat
+        cell array, so the rows, columns and both diagonal families are each
+        covered by strided slices of the array, with steps 1, stride,
+        stride + 1 and stride - 1. Scanning the reversed array with the same
+        steps reads every line backwards.
+
+        Returns:
+            dict: Number of (start cell, direction) matches per word
+        """
+        visits = [0] * len(self.transitions)
+        for cells in (grid.cells, grid.cells[::-1]):
+            for step in (1, grid.stride, grid.stride + 1, grid.stride - 1):
+                for start in range(step):
+                    self.scan(cells[start::step], visits)
+        return self.counts(visits)
+
+def count_words(grid, words):
+    """Count each of words in all 8 directions of the grid in one automaton pass."""
+    return WordAutomaton(words).count_in_grid(grid)
+
 def part1(grid):
     """Count all occurrences of XMAS in the word search."""
     return find_xmas(grid)
@@ -94,8 +256,8 @@ def part2(grid):
     return find_x_mas(grid)
 
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
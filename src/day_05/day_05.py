@@ -1,5 +1,8 @@
-from pathlib import Path
 from collections import defaultdict, deque
+from functools import cmp_to_key
+from itertools import chain
+
+from src.loader import load_input
 
 def parse_input(input_path):
     """Parse the input file and return the ordering rules and updates."""
@@ -75,14 +78,125 @@ def topological_sort(pages, rules):
     
     return result
 
+class RuleIndex:
+    """
+    Ordering rules compiled once into integer bitsets.
+
+    Every page named in a rule gets one bit; `after[page]` holds the bits of
+    the pages that must come after it and `before[page]` those that must
+    come before it. Validating an update is then one AND per page against
+    the pages already seen, and ordering uses a comparator that answers
+    from the bitsets. Ordering and middle_page assume the rules totally
+    order the pages of each update, as the puzzle guarantees.
+    """
+
+    def __init__(self, rules):
+        pages = set(rules).union(*rules.values())
+        self.bit = {page: 1 << i for i, page in enumerate(sorted(pages))}
+        self.after = {page: 0 for page in pages}
+        self.before = {page: 0 for page in pages}
+        for before, after_pages in rules.items():
+            for after_page in after_pages:
+                self.after[before] |= self.bit[after_page]
+                self.before[after_page] |= self.bit[before]
+        self.sort_key = cmp_to_key(self.compare)
+
+    def is_valid(self, pages):
+        """Check if a sequence of pages follows the ordering rules."""
+        after = self.after
+        bit = self.bit
+        seen = 0
+        for page in pages:
+            # A page that must come after this one was already printed
+            if after.get(page, 0) & seen:
+                return False
+            seen |= bit.get(page, 0)
+        return True
+
+    def compare(self, page, other):
+        """Return -1 if page must come before other, 1 if after, 0 if no rule applies."""
+        if self.after.get(page, 0) & self.bit.get(other, 0):
+            return -1
+        if self.after.get(other, 0) & self.bit.get(page, 0):
+            return 1
+        return 0
+
+    def order(self, pages):
+        """Return the pages sorted according to the ordering rules."""
+        return sorted(pages, key=self.sort_key)
+
+    def middle_page(self, pages):
+        """
+        Return the page that would be in the middle once the pages are ordered.
+
+        Under a total order a page's position is the number of other pages
+        in the update that must precede it, so the middle page is the one
+        with exactly len(pages) // 2 of them. That is one popcount per page
+        instead of a sort.
+        """
+        bit = self.bit
+        before = self.before
+        update_mask = 0
+        for page in pages:
+            update_mask |= bit.get(page, 0)
+        middle = len(pages) // 2
+        for page in pages:
+            # bin().count rather than int.bit_count, which needs Python 3.10
+            if bin(before.get(page, 0) & update_mask).count('1') == middle:
+                return page
+        raise ValueError("The rules do not totally order the pages of this update")
+
+    def middle_sums(self, updates):
+        """
+        Check a batch of updates in one call.
+
+        Args:
+            updates (iterable): Page lists; may be a generator of any length
+
+        Returns:
+            tuple: (sum of middle pages of valid updates,
+            sum of middle pages of invalid updates once reordered)
+        """
+        valid_total = 0
+        reordered_total = 0
+        is_valid = self.is_valid
+        middle_page = self.middle_page
+        for update in updates:
+            if is_valid(update):
+                valid_total += get_middle_page(update)
+            else:
+                reordered_total += middle_page(update)
+        return valid_total, reordered_total
+
+def solve_stream(lines):
+    """
+    Solve both parts in one pass over an iterable of lines.
+
+    The rules section is read into memory; updates are then checked one at
+    a time as they arrive, so the number of updates is unbounded.
+    """
+    lines = iter(lines)
+    rules = defaultdict(set)
+    for line in lines:
+        if '|' not in line:
+            # The first update line ends the rules section
+            lines = chain([line], lines)
+            break
+        before, after = map(int, line.split('|'))
+        rules[before].add(after)
+    
+    updates = (list(map(int, line.split(','))) for line in lines if line.strip())
+    return RuleIndex(rules).middle_sums(updates)
+
 def part1(input_data):
     """Find sum of middle pages from correctly ordered updates."""
     rules, updates = input_data
+    index = RuleIndex(rules)
     
     # Find correctly ordered updates and sum their middle pages
     total = 0
     for update in updates:
-        if is_valid_order(update, rules):
+        if index.is_valid(update):
             total += get_middle_page(update)
     
     return total
@@ -90,19 +204,19 @@ def part1(input_data):
 def part2(input_data):
     """Find sum of middle pages from reordered incorrect updates."""
     rules, updates = input_data
+    index = RuleIndex(rules)
     
-    # Find incorrectly ordered updates, sort them, and sum their middle pages
+    # Find incorrectly ordered updates and sum the pages they would have in the middle
     total = 0
     for update in updates:
-        if not is_valid_order(update, rules):
-            sorted_update = topological_sort(update, rules)
-            total += get_middle_page(sorted_update)
+        if not index.is_valid(update):
+            total += index.middle_page(update)
     
     return total
 
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
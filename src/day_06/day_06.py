@@ -1,8 +1,12 @@
-from pathlib import Path
+from bisect import bisect_left, bisect_right
 from enum import Enum
-from typing import Set, Tuple, Optional, List
-from copy import deepcopy
-from tqdm import tqdm
+from typing import Dict, Tuple, Optional, List
+
+from src.grid import BORDER, Grid
+from src.loader import load_input
+from src.telemetry import progress, track
+
+WALL = ord('#')
 
 class Direction(Enum):
     UP = (0, -1, '^')
@@ -14,110 +18,274 @@ class Direction(Enum):
         self.dx = dx
         self.dy = dy
         self.symbol = symbol
-    
-    def turn_right(self) -> 'Direction':
-        """Return the direction after turning 90 degrees right."""
-        directions = list(Direction)
-        current_index = directions.index(self)
-        return directions[(current_index + 1) % 4]
+
+# Directions in turning order, matching Grid.offsets4
+DIRECTIONS = list(Direction)
 
 def parse_input(input_path):
     """Parse the input file and return the map and guard's starting position and direction."""
     with open(input_path, 'r') as file:
-        grid = [list(line.strip()) for line in file if line.strip()]
-        
-        # Find guard's starting position and direction
-        for y, row in enumerate(grid):
-            for x, cell in enumerate(row):
-                if cell in '^>v<':
-                    direction = next(d for d in Direction if d.symbol == cell)
-                    return grid, (x, y), direction
+        grid = Grid.from_lines(file)
+    
+    # Find guard's starting position and direction
+    for index in grid.indices():
+        cell = chr(grid[index])
+        if cell in '^>v<':
+            direction = next(d for d in Direction if d.symbol == cell)
+            return grid, grid.coords(index), direction
     
     raise ValueError("No guard found in input")
 
-def is_valid_position(x: int, y: int, grid: list) -> bool:
-    """Check if a position is within the grid."""
-    return 0 <= y < len(grid) and 0 <= x < len(grid[0])
+def trace_path(grid: Grid, start_pos: Tuple[int, int], start_dir: Direction) -> Dict[int, Optional[Tuple[int, int]]]:
+    """
+    Walk the guard's route and record how it first enters each cell.
 
-def simulate_guard_path(grid: list, start_pos: Tuple[int, int], start_dir: Direction, max_steps: int = 10000) -> set:
-    """Simulate the guard's path and return visited positions."""
-    visited = set()
-    x, y = start_pos
-    direction = start_dir
-    steps = 0
-    
-    while steps < max_steps:
-        # Calculate next position
-        next_x = x + direction.dx
-        next_y = y + direction.dy
-        
-        # Check if next position is valid and not blocked
-        if not is_valid_position(next_x, next_y, grid):
-            break
-        
-        if grid[next_y][next_x] == '#' or grid[next_y][next_x] == 'O':  # Include new obstacle
-            # Turn right if blocked
-            direction = direction.turn_right()
+    Returns:
+        dict: Cell index -> (cell index, direction number) of the state just
+        before the guard first steps onto it, in path order; the start cell
+        maps to None. Direction numbers index grid.offsets4.
+    """
+    offsets = grid.offsets4
+    cells = grid.cells
+    index = grid.index(*start_pos)
+    facing = DIRECTIONS.index(start_dir)
+    first_entry = {index: None}
+    # A guard that never leaves would revisit a state within this many moves
+    for _ in range(4 * len(cells)):
+        next_index = index + offsets[facing]
+        cell = cells[next_index]
+        if cell == BORDER:
+            return first_entry
+        if cell == WALL:
+            facing = (facing + 1) % 4
         else:
-            # Move forward
-            x, y = next_x, next_y
-            pos = (x, y)
-            
-            visited.add(pos)
-            steps += 1
+            if next_index not in first_entry:
+                first_entry[next_index] = (index, facing)
+            index = next_index
+    raise ValueError("The guard never leaves the map")
+
+class ObstacleIndex:
+    """
+    Obstacle positions of a grid, sorted per row and per column.
+
+    The guard walks straight until the next obstacle, so instead of moving
+    one cell at a time it can jump there with one bisect in its row's or
+    column's list. Simulations then cost one jump per turn rather than one
+    iteration per step. Every query takes an optional extra obstacle, which
+    tries out one more obstacle without rebuilding the index.
+    """
+
+    def __init__(self, grid: Grid):
+        self.width = grid.width
+        self.height = grid.height
+        self.rows = [[] for _ in range(grid.height)]
+        self.columns = [[] for _ in range(grid.width)]
+        # Cells come row by row, so every list is built in sorted order
+        for index in grid.indices():
+            if grid[index] == WALL:
+                x, y = grid.coords(index)
+                self.rows[y].append(x)
+                self.columns[x].append(y)
+
+    def jump(self, x: int, y: int, facing: int, extra: Optional[Tuple[int, int]] = None) -> Tuple[int, int, bool]:
+        """
+        Walk from (x, y) in direction number facing until something is in the way.
+
+        Returns:
+            tuple: (x, y, left) where (x, y) is the last cell before the next
+            obstacle, or the last cell on the map and left is True if there
+            is no obstacle ahead
+        """
+        if facing == 0:  # Up
+            column = self.columns[x]
+            i = bisect_left(column, y)
+            stop = column[i - 1] if i else -1
+            if extra is not None and extra[0] == x and stop < extra[1] < y:
+                stop = extra[1]
+            return x, stop + 1, stop < 0
+        if facing == 1:  # Right
+            row = self.rows[y]
+            i = bisect_right(row, x)
+            stop = row[i] if i < len(row) else self.width
+            if extra is not None and extra[1] == y and x < extra[0] < stop:
+                stop = extra[0]
+            return stop - 1, y, stop == self.width
+        if facing == 2:  # Down
+            column = self.columns[x]
+            i = bisect_right(column, y)
+            stop = column[i] if i < len(column) else self.height
+            if extra is not None and extra[0] == x and y < extra[1] < stop:
+                stop = extra[1]
+            return x, stop - 1, stop == self.height
+        # Left
+        row = self.rows[y]
+        i = bisect_left(row, x)
+        stop = row[i - 1] if i else -1
+        if extra is not None and extra[1] == y and stop < extra[0] < x:
+            stop = extra[0]
+        return stop + 1, y, stop < 0
+
+    def route(self, x: int, y: int, facing: int):
+        """
+        Yield the guard's straight runs as (x, y, facing, end_x, end_y) until it leaves the map.
+
+        Raises:
+            ValueError: If the guard never leaves the map
+        """
+        # Without a loop, every turn happens in a different (cell, direction) state
+        for _ in range(4 * self.width * self.height + 1):
+            end_x, end_y, left = self.jump(x, y, facing)
+            yield x, y, facing, end_x, end_y
+            if left:
+                return
+            x, y, facing = end_x, end_y, (facing + 1) % 4
+        raise ValueError("The guard never leaves the map")
+
+    def creates_loop(self, x: int, y: int, facing: int, extra: Tuple[int, int], seen: bytearray) -> bool:
+        """
+        Check if the guard loops once an extra obstacle is added.
+
+        The walk starts at (x, y), facing direction number facing. A loop
+        is detected exactly when the guard turns in a (cell, direction)
+        state it turned in before; `seen` is a bitset with one byte per cell
+        (y * width + x) and one bit per direction, which must be all zero
+        and is left all zero on return.
+        """
+        width = self.width
+        jump = self.jump
+        turns = []
+        loop = False
+        while True:
+            x, y, left = jump(x, y, facing, extra)
+            if left:
+                break
+            position = y * width + x
+            bit = 1 << facing
+            if seen[position] & bit:
+                loop = True
+                break
+            seen[position] |= bit
+            turns.append(position)
+            facing = (facing + 1) % 4
+        
+        # Reset only the cells this walk marked
+        for position in turns:
+            seen[position] = 0
+        return loop
+
+def count_visited(grid: Grid, start_pos: Tuple[int, int], start_dir: Direction) -> int:
+    """
+    Count the distinct cells the guard visits, including the start.
+
+    The route is followed run by run with an ObstacleIndex, and each run
+    marks its cells with one strided slice assignment.
+    """
+    visited = bytearray(len(grid.cells))
+    offsets = grid.offsets4
+    for x, y, facing, end_x, end_y in ObstacleIndex(grid).route(*start_pos, DIRECTIONS.index(start_dir)):
+        step = offsets[facing]
+        first, last = grid.index(x, y), grid.index(end_x, end_y)
+        visited[first:last + step:step] = b'\x01' * ((last - first) // step + 1)
+    return visited.count(1)
+
+def find_loop_positions(grid: Grid, start_pos: Tuple[int, int], start_dir: Direction, jobs: Optional[int] = 1) -> List[Tuple[int, int]]:
+    """
+    Find all positions where adding an obstacle creates a loop.
+
+    Only cells on the guard's original route can change it. Each of them is
+    tried with the walk resumed from the state just before the guard first
+    reaches it, since the route up to there is unchanged, and the walk
+    jumps from obstacle to obstacle with an ObstacleIndex.
+
+    Args:
+        grid (Grid): The lab map
+        start_pos (tuple): Guard's starting (x, y) position
+        start_dir (Direction): Guard's starting direction
+        jobs (int): Worker processes to split the candidates across;
+            1 runs in this process, None uses every CPU
+
+    Returns:
+        list: (x, y) positions in the order the guard first reaches them
+    """
+    first_entry = trace_path(grid, start_pos, start_dir)
+    candidates = [(obstacle, index, facing)
+                  for obstacle, (index, facing) in list(first_entry.items())[1:]]  # Skip the start position
     
-    return visited
+    if jobs != 1:
+        return _find_loops_parallel(grid, candidates, jobs)
+    
+    candidates = track(candidates, "day 6 loop search", "cells")
+    return _find_loops(grid, ObstacleIndex(grid), candidates)
 
-def find_loop_positions(grid: list, start_pos: Tuple[int, int], start_dir: Direction) -> List[Tuple[int, int]]:
-    """Find all positions where adding an obstacle creates a loop."""
-    height = len(grid)
-    width = len(grid[0])
+def _find_loops(grid, obstacles, candidates):
+    """Return the positions of the (obstacle, start index, facing) candidates that create a loop."""
     loop_positions = []
+    seen = bytearray(grid.width * grid.height)
+    for obstacle, index, facing in candidates:
+        position = grid.coords(obstacle)
+        if obstacles.creates_loop(*grid.coords(index), facing, position, seen):
+            loop_positions.append(position)
+    return loop_positions
+
+def _find_loops_parallel(grid, candidates, jobs=None):
+    """
+    Split loop candidates across a process pool.
+
+    The map is copied once into a shared memory block that every worker
+    reads in place. The extra obstacle of each candidate only exists in the
+    worker's jump queries, so workers never copy or modify the map.
+    """
+    import multiprocessing
+    import os
+    from multiprocessing import shared_memory
     
-    # First, simulate the original path
-    original_path = simulate_guard_path(grid, start_pos, start_dir)
+    jobs = jobs or os.cpu_count() or 1
+    # Several chunks per worker even out chunks whose walks run longer
+    chunk_size = max(1, -(-len(candidates) // (jobs * 4)))
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
     
-    # Try each empty position
-    for y in tqdm(range(height), desc="Searching loop positions", total=height):
-        for x in tqdm(range(width), desc=f"Row {y}", total=width, leave=False):
-            # Skip positions that are already occupied or the start position
-            if grid[y][x] != '.' or (x, y) == start_pos:
-                continue
-            
-            # Create a copy of the grid and add an obstacle
-            test_grid = deepcopy(grid)
-            test_grid[y][x] = 'O'
-            
-            # Simulate path with obstacle
-            obstructed_path = simulate_guard_path(test_grid, start_pos, start_dir)
-            
-            # Check if the paths are different (indicating a loop)
-            if len(obstructed_path) < len(original_path):
-                loop_positions.append((x, y))
+    memory = shared_memory.SharedMemory(create=True, size=len(grid.cells))
+    try:
+        memory.buf[:len(grid.cells)] = grid.cells
+        with multiprocessing.Pool(jobs, _init_loop_worker, (memory.name, grid.width, grid.height)) as pool, \
+                progress("day 6 loop search", "cells", len(candidates)) as tracker:
+            results = []
+            for chunk, loop_positions in zip(chunks, pool.imap(_find_loops_in_chunk, chunks)):
+                results.append(loop_positions)
+                tracker.add(len(chunk))
+    finally:
+        memory.close()
+        memory.unlink()
+    return [position for chunk in results for position in chunk]
+
+# Per-process state of a _find_loops_parallel worker, set by _init_loop_worker
+_loop_worker = {}
+
+def _init_loop_worker(name, width, height):
+    """Attach a pool worker to the shared map and index its obstacles once."""
+    from multiprocessing import shared_memory
     
-    return loop_positions
+    memory = shared_memory.SharedMemory(name=name)
+    grid = Grid(width, height, memory.buf[:(width + 2) * (height + 2)])
+    _loop_worker.update(memory=memory, grid=grid, obstacles=ObstacleIndex(grid))
+
+def _find_loops_in_chunk(candidates):
+    return _find_loops(_loop_worker['grid'], _loop_worker['obstacles'], candidates)
 
 def part1(input_data):
     """Count distinct positions the guard will visit."""
     grid, start_pos, start_dir = input_data
-    print(f"Start position: {start_pos}, Start direction: {start_dir}")
-    print(f"Grid size: {len(grid)}x{len(grid[0])}")
-    visited = simulate_guard_path(grid, start_pos, start_dir, max_steps=10000)
-    print(f"Visited positions: {len(visited)}")
-    return len(visited)
+    return count_visited(grid, start_pos, start_dir)
 
 def part2(input_data):
     """Count positions where adding an obstacle creates a loop."""
     grid, start_pos, start_dir = input_data
-    print(f"Start position: {start_pos}, Start direction: {start_dir}")
-    print(f"Grid size: {len(grid)}x{len(grid[0])}")
     loop_positions = find_loop_positions(grid, start_pos, start_dir)
-    print(f"Loop positions: {len(loop_positions)}")
     return len(loop_positions)
 
 def main():
-    # Load input from the script's directory
-    input_data = parse_input(Path(__file__).parent / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
@@ -1,15 +1,17 @@
-from pathlib import Path
-from itertools import product
+from src.loader import load_input
+from src.telemetry import track
 
 def parse_input(input_path):
     """Parse the input file and return a list of equations."""
-    equations = []
     with open(input_path, 'r') as file:
-        for line in file:
-            test_value, numbers_str = line.strip().split(': ')
-            numbers = list(map(int, numbers_str.split()))
-            equations.append((int(test_value), numbers))
-    return equations
+        return list(parse_lines(file))
+
+def parse_lines(lines):
+    """Yield (test_value, numbers) equations from an iterable of lines."""
+    for line in lines:
+        test_value, numbers_str = line.strip().split(': ')
+        numbers = list(map(int, numbers_str.split()))
+        yield int(test_value), numbers
 
 def concatenate(a, b):
     """Concatenate two numbers."""
@@ -31,21 +33,52 @@ def evaluate_equation(numbers, operators):
             result = concatenate(result, numbers[i+1])
     return result
 
-def is_equation_possible(test_value, numbers):
+def is_equation_possible(test_value, numbers, concatenation=True):
     """
     Check if the equation can be made true by inserting operators.
+
+    Works right to left from test_value: the last number can only have been
+    added if subtracting it leaves a non-negative value, multiplied if it
+    divides exactly, and concatenated if the value ends in its digits.
+    Each surviving branch continues with the number before it, so most
+    branches die after one step instead of all 3^(n-1) operator
+    combinations being evaluated. Numbers must be non-negative.
+
+    Args:
+        test_value (int): Value the equation must produce
+        numbers (list): Numbers in order, operators go between them
+        concatenation (bool): Also allow the || operator
+
+    Returns:
+        bool: True as soon as one combination of operators works
     """
-    # Number of operator positions is one less than number of numbers
-    num_positions = len(numbers) - 1
-    
-    # Try all possible operator combinations (now including ||)
-    for ops in product(['+', '*', '||'], repeat=num_positions):
-        try:
-            if evaluate_equation(numbers, ops) == test_value:
+    # Pending (value the first last + 1 numbers must produce, last) branches
+    stack = [(test_value, len(numbers) - 1)]
+    while stack:
+        target, last = stack.pop()
+        number = numbers[last]
+        if last == 0:
+            if target == number:
                 return True
-        except Exception:
-            # In case of overflow or other calculation issues
             continue
+        
+        # Addition: the numbers before are never negative
+        if target >= number:
+            stack.append((target - number, last - 1))
+        
+        # Multiplication: anything times 0 is 0
+        if number == 0:
+            if target == 0:
+                return True
+        elif target % number == 0:
+            stack.append((target // number, last - 1))
+        
+        # Concatenation: a || number == a * 10**digits + number
+        if concatenation:
+            shift = 10 ** len(str(number))
+            remainder = target - number
+            if remainder >= 0 and remainder % shift == 0:
+                stack.append((remainder // shift, last - 1))
     
     return False
 
@@ -54,19 +87,28 @@ def part1(equations):
     Calculate the total calibration result by summing test values 
     of possible equations.
     """
-    return sum(test_value for test_value, numbers in equations 
+    return sum(test_value for test_value, numbers in track(equations, "day 7 part 1", "equations")
                if is_equation_possible(test_value, numbers))
 
 def part2(equations):
     """
     Calculate the total calibration result using all three operators.
     """
-    return sum(test_value for test_value, numbers in equations 
+    return sum(test_value for test_value, numbers in track(equations, "day 7 part 2", "equations")
                if is_equation_possible(test_value, numbers))
 
+def solve_stream(lines):
+    """Solve both parts in one pass, holding a single equation in memory at a time."""
+    total = 0
+    for test_value, numbers in track(parse_lines(lines), "day 7 stream", "equations"):
+        if is_equation_possible(test_value, numbers):
+            total += test_value
+    # Both parts currently accept the same operators
+    return total, total
+
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
@@ -1,20 +1,26 @@
-from pathlib import Path
 from typing import Dict, List, Tuple, Set
 
+from src.grid import Grid
+from src.loader import load_input
+
+EMPTY, ZERO = b'.0'
+
 def parse_input(input_path):
-    """Parse the input file and return a 2D grid of antenna locations."""
+    """Parse the input file and return a grid of antenna locations."""
     with open(input_path, 'r') as file:
-        return [list(line.strip()) for line in file if line.strip()]
+        return Grid.from_lines(file)
 
-def find_antennas(grid: List[List[str]]) -> Dict[str, List[Tuple[int, int]]]:
+def find_antennas(grid: Grid) -> Dict[str, List[Tuple[int, int]]]:
     """Find all antenna locations grouped by their exact frequency."""
     antennas = {}
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell != '.' and cell != '0':
-                if cell not in antennas:
-                    antennas[cell] = []
-                antennas[cell].append((x, y))
+    cells = grid.cells
+    for index in grid.indices():
+        cell = cells[index]
+        if cell != EMPTY and cell != ZERO:
+            frequency = chr(cell)
+            if frequency not in antennas:
+                antennas[frequency] = []
+            antennas[frequency].append(grid.coords(index))
     return antennas
 
 def calculate_antinodes(antennas: List[Tuple[int, int]], grid_width: int, grid_height: int) -> Set[Tuple[int, int]]:
@@ -46,7 +52,7 @@ def calculate_antinodes(antennas: List[Tuple[int, int]], grid_width: int, grid_h
     
     return antinodes
 
-def part1(grid: List[List[str]]) -> int:
+def part1(grid: Grid) -> int:
     """
     Calculate the number of unique antinode locations.
     
@@ -54,36 +60,29 @@ def part1(grid: List[List[str]]) -> int:
     have an antinode point exactly between them.
     """
     # Grid dimensions
-    grid_width = len(grid[0])
-    grid_height = len(grid)
+    grid_width = grid.width
+    grid_height = grid.height
     
     # Find all antenna locations
     antennas = find_antennas(grid)
     
-    # Detailed logging
-    print("Antenna frequencies:")
-    for freq, locations in antennas.items():
-        print(f"{freq}: {len(locations)} antennas")
-    
     # Collect all unique antinodes
     all_antinodes = set()
     for freq, freq_antennas in antennas.items():
         # Only process frequencies with at least 2 antennas
         if len(freq_antennas) >= 2:
             freq_antinodes = calculate_antinodes(freq_antennas, grid_width, grid_height)
-            print(f"{freq}: {len(freq_antinodes)} antinodes")
             all_antinodes.update(freq_antinodes)
     
-    print(f"\nTotal unique antinodes: {len(all_antinodes)}")
     return len(all_antinodes)
 
-def part2(grid: List[List[str]]) -> int:
+def part2(grid: Grid) -> int:
     """Part 2 is not specified in the problem description."""
     return None
 
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
@@ -1,4 +1,4 @@
-from pathlib import Path
+from src.loader import load_input
 
 def parse_input(input_path):
     """Parse the input file and return the data."""
@@ -72,8 +72,8 @@ def part2(input_data):
     return None
 
 def main():
-    # Load input from the current working directory
-    input_data = parse_input(Path.cwd() / 'input.txt')
+    # Load input from the module's directory
+    input_data = load_input(__file__, parse_input)
     
     # Solve parts
     print("Part 1:", part1(input_data))
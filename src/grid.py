@@ -0,0 +1,135 @@
+"""Compact character grid stored in one flat bytearray with a sentinel border."""
+
+# Byte value of the border cells surrounding every grid
+BORDER = 0
+
+class Grid:
+    """
+    Rectangular character grid backed by a single bytearray.
+
+    Cells are addressed by one integer index instead of (x, y) pairs. The
+    grid is surrounded by a one-cell border of BORDER bytes, so stepping one
+    cell past any edge lands on the sentinel: walks can stop when they read
+    BORDER instead of checking bounds on every step. Rows are `stride`
+    (width + 2) bytes apart, which makes every neighbour a fixed offset.
+    """
+
+    __slots__ = ('width', 'height', 'stride', 'cells', 'offsets4', 'offsets8')
+
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.cells = cells if cells is not None else bytearray((height + 2) * self.stride)
+        stride = self.stride
+        # Up, right, down, left
+        self.offsets4 = (-stride, 1, stride, -1)
+        # The four above plus up-right, down-right, down-left, up-left
+        self.offsets8 = self.offsets4 + (1 - stride, stride + 1, stride - 1, -stride - 1)
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Build a grid from an iterable of text lines, skipping blank ones."""
+        rows = [line.strip().encode() for line in lines if line.strip()]
+        if not rows:
+            raise ValueError("Empty grid")
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("Grid rows differ in length")
+        grid = cls(width, len(rows))
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start:start + width] = row
+        return grid
+
+    def index(self, x, y):
+        """Return the cell index of column x, row y."""
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, index):
+        """Return the (x, y) position of a cell index."""
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def contains(self, x, y):
+        """Check if a position is within the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def get(self, x, y):
+        """Return the character at (x, y), or None outside the grid."""
+        if not self.contains(x, y):
+            return None
+        return chr(self.cells[self.index(x, y)])
+
+    def indices(self):
+        """Iterate over the index of every cell inside the border, row by row."""
+        stride = self.stride
+        for row_start in range(stride + 1, (self.height + 1) * stride, stride):
+            yield from range(row_start, row_start + self.width)
+
+    def find(self, char):
+        """Return the index of the first cell holding char, or -1."""
+        return self.cells.find(char.encode())
+
+    def row(self, y):
+        """Return row y as a string."""
+        start = self.index(0, y)
+        return self.cells[start:start + self.width].decode()
+
+    def lines(self):
+        """Return the grid as a list of strings, one per row."""
+        return [self.row(y) for y in range(self.height)]
+
+    def copy(self):
+        """Return an independent copy of the grid."""
+        return Grid(self.width, self.height, bytearray(self.cells))
+
+    def overlay(self, changes=None):
+        """Return a copy-on-write view of this grid; see GridOverlay."""
+        return GridOverlay(self, changes)
+
+class GridOverlay:
+    """
+    Copy-on-write view of a Grid.
+
+    Writes go to a small dict of changed cells and reads fall back to the
+    base grid, so trying out a one-cell change costs O(1) instead of copying
+    the whole grid. The base grid must not be modified while overlays of it
+    are in use.
+    """
+
+    __slots__ = ('base', 'changes', 'width', 'height', 'stride', 'offsets4', 'offsets8')
+
+    def __init__(self, base, changes=None):
+        self.base = base
+        self.changes = dict(changes or {})
+        self.width = base.width
+        self.height = base.height
+        self.stride = base.stride
+        self.offsets4 = base.offsets4
+        self.offsets8 = base.offsets8
+
+    def __getitem__(self, index):
+        value = self.changes.get(index)
+        return self.base.cells[index] if value is None else value
+
+    def __setitem__(self, index, value):
+        self.changes[index] = value
+
+    index = Grid.index
+    coords = Grid.coords
+    contains = Grid.contains
+    indices = Grid.indices
+
+    def materialize(self):
+        """Return a standalone Grid with the overlay's changes applied."""
+        grid = self.base.copy()
+        for index, value in self.changes.items():
+            grid.cells[index] = value
+        return grid
@@ -0,0 +1,80 @@
+"""Per-day import cost measured with the interpreter's -X importtime report."""
+
+import subprocess
+import sys
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        list: (self_us, cumulative_us, depth, module_name) in report order
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # column header
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((int(parts[0]), int(parts[1]), depth, name.strip()))
+    return entries
+
+def measure_import(module_name, cwd=None):
+    """
+    Import a module in a fresh interpreter and return its import cost.
+
+    Modules the interpreter loads at startup are not counted, so the result
+    is what `import module_name` adds on top of a bare interpreter.
+
+    Returns:
+        dict: 'cumulative_ms' for the module and 'heaviest', its most
+        expensive direct dependencies as (name, cumulative_ms) pairs,
+        or None if the module could not be imported
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module_name}"],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return None
+
+    entries = parse_importtime(completed.stderr)
+    for index, (_, cumulative, depth, name) in enumerate(entries):
+        if name == module_name:
+            break
+    else:
+        return None
+
+    # Descendants are reported before their parent, one level deeper per import
+    children = []
+    for _, child_cumulative, child_depth, child_name in reversed(entries[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((child_name, child_cumulative / 1000))
+    children.sort(key=lambda child: child[1], reverse=True)
+    return {'cumulative_ms': cumulative / 1000, 'heaviest': children[:3]}
+
+def report_import_times(days, budget_ms, cwd=None):
+    """
+    Print the import cost of each day module and check it against a budget.
+
+    Returns:
+        list: Days whose import cost exceeded budget_ms
+    """
+    over_budget = []
+    for day in days:
+        module_name = f"src.day_{day:02d}.day_{day:02d}"
+        result = measure_import(module_name, cwd)
+        if result is None:
+            print(f"Day {day:2d}  could not be imported")
+            continue
+        heaviest = ", ".join(f"{name} {ms:.1f}ms" for name, ms in result['heaviest'])
+        flag = "  OVER BUDGET" if result['cumulative_ms'] > budget_ms else ""
+        print(f"Day {day:2d}  {result['cumulative_ms']:8.1f}ms  ({heaviest}){flag}")
+        if flag:
+            over_budget.append(day)
+    return over_budget
@@ -0,0 +1,191 @@
+"""Seeded generators of valid, arbitrarily large inputs for days 1-9.
+
+Scale 1 produces an input of roughly the same size as the shipped
+input.txt; scale N produces about N times as much data (N times as many
+lines, or N times the cells for grid days). The same (day, scale, seed)
+always produces the same text.
+"""
+
+import math
+import random
+import string
+from pathlib import Path
+
+def _grid_side(base_side, scale):
+    """Side length of a square grid with `scale` times the cells of base_side**2."""
+    return max(4, round(base_side * math.sqrt(scale)))
+
+def generate_day_01(rng, scale):
+    """Two columns of 5-digit location ids; the right column reuses left ids."""
+    count = 1000 * scale
+    left = [rng.randint(10000, 99999) for _ in range(count)]
+    lines = []
+    for value in left:
+        right = rng.choice(left) if rng.random() < 0.5 else rng.randint(10000, 99999)
+        lines.append(f"{value}   {right}")
+    return '\n'.join(lines) + '\n'
+
+def generate_day_02(rng, scale):
+    """Reports of 5-8 levels, most monotonic with steps of 1-3, some with one bad level."""
+    lines = []
+    for _ in range(1000 * scale):
+        length = rng.randint(5, 8)
+        step = rng.choice((1, -1))
+        level = rng.randint(10, 80)
+        report = [level]
+        for _ in range(length - 1):
+            level += step * rng.randint(1, 3)
+            report.append(level)
+        if rng.random() < 0.6:
+            report[rng.randrange(length)] += rng.randint(-4, 4)
+        lines.append(' '.join(map(str, report)))
+    return '\n'.join(lines) + '\n'
+
+def generate_day_03(rng, scale):
+    """Lines of corrupted memory mixing valid and broken mul(), do() and don't()."""
+    junk = "!@#$%^&*()[]{}<>?/\\'~+-:; ,"
+    fragments = [
+        lambda: f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})",
+        lambda: f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})",
+        lambda: f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})",
+        lambda: f"mul[{rng.randint(1, 999)},{rng.randint(1, 999)}]",
+        lambda: f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)})",
+        lambda: f"mul({rng.randint(1000, 9999)},{rng.randint(1, 999)})",
+        lambda: "do()",
+        lambda: "don't()",
+        lambda: rng.choice(("why()", "what()", "from()", "select()", "when()", "who()")),
+        lambda: ''.join(rng.choice(junk) for _ in range(rng.randint(1, 4))),
+        lambda: ''.join(rng.choice(junk) for _ in range(rng.randint(1, 4))),
+    ]
+    lines = []
+    for _ in range(6 * scale):
+        pieces = []
+        length = 0
+        while length < 3200:
+            piece = rng.choice(fragments)()
+            pieces.append(piece)
+            length += len(piece)
+        lines.append(''.join(pieces))
+    return '\n'.join(lines) + '\n'
+
+def generate_day_04(rng, scale):
+    """Square word search of the letters X, M, A and S."""
+    side = _grid_side(140, scale)
+    return ''.join(''.join(rng.choice('XMAS') for _ in range(side)) + '\n' for _ in range(side))
+
+def generate_day_05(rng, scale):
+    """Rules for every pair of 49 pages under a hidden order, then odd-length updates."""
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{before}|{after}" for i, before in enumerate(pages) for after in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(200 * scale):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(map(str, update)))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates) + '\n'
+
+def generate_day_06(rng, scale):
+    """Square lab map with ~5% obstacles and the guard facing up."""
+    side = _grid_side(130, scale)
+    rows = [['#' if rng.random() < 0.047 else '.' for _ in range(side)] for _ in range(side)]
+    while True:
+        x, y = rng.randrange(side), rng.randrange(side)
+        if rows[y][x] == '.' and _guard_leaves(rows, x, y):
+            rows[y][x] = '^'
+            break
+    return ''.join(''.join(row) + '\n' for row in rows)
+
+def _guard_leaves(rows, x, y):
+    """Return True if a guard starting at (x, y) facing up walks off the map."""
+    dx, dy = 0, -1
+    seen = set()
+    while (x, y, dx, dy) not in seen:
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= ny < len(rows) and 0 <= nx < len(rows[0])):
+            return True
+        if rows[ny][nx] == '#':
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+    return False
+
+def generate_day_07(rng, scale):
+    """Calibration equations of 3-12 numbers; about half are solvable."""
+    lines = []
+    for _ in range(850 * scale):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        if rng.random() < 0.5:
+            value = numbers[0]
+            for number in numbers[1:]:
+                operator = rng.choice('+*|')
+                if operator == '+':
+                    value += number
+                elif operator == '*':
+                    value *= number
+                else:
+                    value = int(f"{value}{number}")
+        else:
+            value = rng.randint(1, 10 ** rng.randint(3, 14))
+        lines.append(f"{value}: {' '.join(map(str, numbers))}")
+    return '\n'.join(lines) + '\n'
+
+def generate_day_08(rng, scale):
+    """Square antenna map with about four antennas per frequency."""
+    side = _grid_side(50, scale)
+    frequencies = string.digits[1:] + string.ascii_letters
+    rows = [['.'] * side for _ in range(side)]
+    antennas = min(side * side // 4, 180 * scale)
+    for i in range(antennas):
+        frequency = frequencies[i % len(frequencies)]
+        while True:
+            x, y = rng.randrange(side), rng.randrange(side)
+            if rows[y][x] == '.':
+                rows[y][x] = frequency
+                break
+    return ''.join(''.join(row) + '\n' for row in rows)
+
+def generate_day_09(rng, scale):
+    """Disk map alternating file lengths (1-9) and gap lengths (0-9), ending on a file."""
+    digits = []
+    for i in range(20000 * scale - 1):
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+    return ''.join(digits) + '\n'
+
+GENERATORS = {
+    1: generate_day_01,
+    2: generate_day_02,
+    3: generate_day_03,
+    4: generate_day_04,
+    5: generate_day_05,
+    6: generate_day_06,
+    7: generate_day_07,
+    8: generate_day_08,
+    9: generate_day_09,
+}
+
+def generate_input(day, scale=1, seed=2024):
+    """
+    Generate the input text for a day.
+
+    Args:
+        day (int): Day number with a generator (1-9)
+        scale (int): Size multiplier relative to the shipped input
+        seed (int): Random seed; each day derives its own stream from it
+
+    Returns:
+        str: The generated input text
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for Day {day}")
+    rng = random.Random(seed * 100 + day)
+    return GENERATORS[day](rng, scale)
+
+def write_input(day, scale, directory, seed=2024):
+    """Generate a day's input and write it to `directory`, returning the file path."""
+    path = Path(directory) / f"day_{day:02d}_x{scale}.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate_input(day, scale, seed))
+    return path
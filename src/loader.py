@@ -0,0 +1,136 @@
+"""Shared input loading with an on-disk cache of parsed inputs."""
+
+import hashlib
+import os
+import sys
+import types
+from pathlib import Path
+
+# Cache location, overridable with AOC_CACHE_DIR
+CACHE_DIR = Path(os.environ.get('AOC_CACHE_DIR', Path(__file__).resolve().parent.parent / '.cache'))
+
+def cache_enabled():
+    """Return False when caching is switched off through AOC_NO_CACHE."""
+    return os.environ.get('AOC_NO_CACHE', '') in ('', '0')
+
+def day_input_path(module_file, name='input.txt'):
+    """Return the input file that sits next to a day module."""
+    return Path(module_file).resolve().parent / name
+
+def iter_lines(source):
+    """
+    Yield the non-blank lines of a file, or of stdin when source is '-', one at a time.
+
+    Only the current line is held in memory, so arbitrarily large inputs can
+    be streamed through a day's solve_stream.
+    """
+    if str(source) == '-':
+        for line in sys.stdin:
+            if line.strip():
+                yield line
+        return
+    with open(source, 'r') as file:
+        for line in file:
+            if line.strip():
+                yield line
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def source_digest(obj):
+    """Return the SHA-256 hex digest of a function's or module's source code."""
+    import inspect
+
+    try:
+        source = inspect.getsource(obj)
+    except (OSError, TypeError):
+        source = getattr(obj, '__qualname__', repr(obj))
+    return hashlib.sha256(source.encode()).hexdigest()
+
+def module_digest(module):
+    """
+    Return a hash covering a day module's source and the shared src modules it uses.
+
+    Helpers imported from other src modules (loader, grid, ...) are included
+    so that editing them also invalidates the day's cached results.
+    """
+    names = {module.__name__}
+    for value in vars(module).values():
+        owner = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, '__module__', None)
+        if isinstance(owner, str) and owner.startswith('src.'):
+            names.add(owner)
+    digest = hashlib.sha256()
+    for name in sorted(names):
+        if name in sys.modules:
+            digest.update(source_digest(sys.modules[name]).encode())
+    return digest.hexdigest()
+
+def parse_cache_path(input_path, parser):
+    """
+    Return the cache file for an input parsed by a given parser.
+
+    The key covers the parser's whole module and the src modules it uses,
+    since parsers delegate to helpers such as parse_lines or Grid.from_lines.
+    """
+    module = sys.modules.get(parser.__module__)
+    code_hash = module_digest(module) if module is not None else source_digest(parser)
+    key = hashlib.sha256(
+        f"{parser.__module__}:{parser.__qualname__}:{file_digest(input_path)}:{code_hash}".encode()
+    ).hexdigest()
+    return CACHE_DIR / 'parsed' / f"{key}.pickle"
+
+def load_input(module_file, parser, name='input.txt', use_cache=None):
+    """
+    Find a day's input file and parse it, reusing a cached result if possible.
+
+    The input is resolved relative to the day module, not the working
+    directory. Parsed results are pickled under CACHE_DIR, keyed by a hash of
+    the input file and of the parser's module and the src modules it uses
+    (see parse_cache_path), so editing any of them invalidates the entry.
+    Unreadable cache entries are ignored and rebuilt.
+
+    Args:
+        module_file (str): The calling module's __file__
+        parser (callable): The day's parse_input function
+        name (str): Input file name next to the module
+        use_cache (bool): Override AOC_NO_CACHE for this call
+
+    Returns:
+        The value returned by parser for the input file
+    """
+    # pickle and tempfile are only needed on this path, keep them out of module import
+    import pickle
+    import tempfile
+
+    input_path = day_input_path(module_file, name)
+    if use_cache is None:
+        use_cache = cache_enabled()
+    if not use_cache:
+        return parser(input_path)
+
+    cache_path = parse_cache_path(input_path, parser)
+    try:
+        with open(cache_path, 'rb') as file:
+            return pickle.load(file)
+    except Exception:
+        pass
+
+    data = parser(input_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    except OSError:
+        return data
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        os.unlink(tmp_path)
+    return data
@@ -0,0 +1,105 @@
+"""Per-day profiling: cProfile statistics and collapsed stacks for flamegraphs."""
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import signal
+from collections import Counter
+from pathlib import Path
+
+from src.benchmark import load_day
+from src.loader import load_input
+
+class StackSampler:
+    """
+    Sampling profiler that records collapsed call stacks.
+
+    A SIGPROF timer interrupts the main thread every `interval` seconds of
+    CPU time and the current Python stack is counted. The output format is
+    one `frame;frame;frame count` line per distinct stack, as read by
+    flamegraph.pl, speedscope and inferno. Only available on platforms with
+    signal.setitimer.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self._root = None
+
+    @staticmethod
+    def available():
+        return hasattr(signal, 'setitimer') and hasattr(signal, 'SIGPROF')
+
+    def _sample(self, signum, frame):
+        names = []
+        while frame is not None and frame.f_code is not self._root:
+            code = frame.f_code
+            names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        if names:
+            self.stacks[';'.join(reversed(names))] += 1
+
+    def run(self, func, *args):
+        """Call func(*args) while sampling and return its result."""
+        self._root = StackSampler.run.__code__
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func(*args)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def write(self, path):
+        """Write the collapsed stacks to a text file."""
+        with open(path, 'w') as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
+
+def profile_day(day_number, output_dir='profiles', top=15, interval=0.001):
+    """
+    Profile part1 and part2 of a day.
+
+    For each part this writes `day_NN_partN.pstats` (cProfile) and
+    `day_NN_partN.folded` (collapsed stacks) to output_dir and prints the
+    top functions by own time. The part runs once per profiler so the
+    sampler's signal handler does not show up in the cProfile statistics.
+    Output printed by the solution itself is discarded.
+
+    Returns:
+        list: Paths of the files written
+    """
+    day_module = load_day(day_number)
+    input_data = load_input(day_module.__file__, day_module.parse_input)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    for part in ('part1', 'part2'):
+        func = getattr(day_module, part)
+        stem = output_dir / f"day_{day_number:02d}_{part}"
+
+        profiler = cProfile.Profile()
+        with contextlib.redirect_stdout(io.StringIO()):
+            profiler.runcall(func, input_data)
+        profiler.dump_stats(f"{stem}.pstats")
+        written.append(f"{stem}.pstats")
+
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        stats.sort_stats('tottime').print_stats(top)
+        print(f"\n{'='*20}\nDay {day_number} {part}\n{'='*20}")
+        print(report.getvalue().strip())
+
+        if StackSampler.available():
+            sampler = StackSampler(interval)
+            with contextlib.redirect_stdout(io.StringIO()):
+                sampler.run(func, input_data)
+            sampler.write(f"{stem}.folded")
+            written.append(f"{stem}.folded")
+        else:
+            print("Collapsed stacks skipped: signal.setitimer is not available on this platform")
+
+    return written
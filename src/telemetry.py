@@ -0,0 +1,158 @@
+"""Opt-in progress and throughput reporting for long-running loops.
+
+Telemetry is off unless the AOC_TELEMETRY environment variable is set:
+'stderr' (or '1') prints one line per report to stderr and 'json' prints
+one JSON object per line instead. Reports are rate-limited to one every
+AOC_TELEMETRY_INTERVAL seconds (default 1) per tracker, plus a final one.
+While disabled, track() returns its iterable unchanged and progress()
+returns a shared no-op tracker, so instrumented loops cost nothing extra.
+"""
+
+import json
+import os
+import sys
+import time
+
+FORMATS = ('stderr', 'json')
+
+def telemetry_format():
+    """Return the configured report format, or None when telemetry is off."""
+    value = os.environ.get('AOC_TELEMETRY', '').lower()
+    if value in ('', '0'):
+        return None
+    if value == '1':
+        return 'stderr'
+    if value not in FORMATS:
+        raise ValueError(f"AOC_TELEMETRY must be one of 0, 1, {', '.join(FORMATS)}, got {value!r}")
+    return value
+
+def enabled():
+    """Return True when telemetry is switched on through AOC_TELEMETRY."""
+    return telemetry_format() is not None
+
+class Progress:
+    """
+    Counts units of work and reports their throughput.
+
+    Reading the clock on every add() would cost more than many of the loops
+    being measured, so the clock is only read after enough units for about
+    a tenth of the reporting interval, estimated from the rate so far. That
+    stride at most doubles per check, so a few fast first units cannot
+    stretch it past the slow ones that follow.
+    """
+
+    def __init__(self, name, unit='items', total=None, output='stderr', interval=1.0, stream=None):
+        self.name = name
+        self.unit = unit
+        self.total = total
+        self.output = output
+        self.interval = interval
+        self.stream = stream
+        self.count = 0
+        self.start = time.perf_counter()
+        self._last_report = self.start
+        self._stride = 1
+        self._next_check = 1
+        self._closed = False
+
+    def add(self, count=1):
+        """Record count more units of work."""
+        self.count += count
+        if self.count >= self._next_check:
+            self._check()
+
+    def _check(self):
+        now = time.perf_counter()
+        elapsed = now - self.start
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        self._stride = max(1, min(int(rate * self.interval / 10), 2 * self._stride))
+        self._next_check = self.count + self._stride
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report(now)
+
+    def report(self, now=None, done=False):
+        """Write one report of the progress so far."""
+        elapsed = (now or time.perf_counter()) - self.start
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        stream = self.stream or sys.stderr
+        if self.output == 'json':
+            record = {'name': self.name, 'count': self.count, 'total': self.total, 'unit': self.unit,
+                      'elapsed': round(elapsed, 6), 'rate': round(rate, 3), 'done': done}
+            stream.write(json.dumps(record) + '\n')
+        else:
+            count = f"{self.count}/{self.total}" if self.total is not None else f"{self.count}"
+            status = " done" if done else ""
+            stream.write(f"[{self.name}] {count} {self.unit}, {rate:,.0f} {self.unit}/s, "
+                         f"{elapsed:.2f}s{status}\n")
+        stream.flush()
+
+    def close(self):
+        """Write the final report; later calls do nothing."""
+        if not self._closed:
+            self._closed = True
+            self.report(done=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class _NullProgress:
+    """Stand-in returned by progress() while telemetry is disabled."""
+
+    count = 0
+
+    def add(self, count=1):
+        pass
+
+    def report(self, now=None, done=False):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+NULL_PROGRESS = _NullProgress()
+
+def progress(name, unit='items', total=None):
+    """
+    Return a tracker to call add() on, or a no-op one while telemetry is disabled.
+
+    Args:
+        name (str): Label of the reports
+        unit (str): What is being counted, e.g. 'cells' or 'equations'
+        total (int): Expected number of units, if known
+
+    Returns:
+        Progress: Use as a context manager so the final report is written
+    """
+    output = telemetry_format()
+    if output is None:
+        return NULL_PROGRESS
+    interval = float(os.environ.get('AOC_TELEMETRY_INTERVAL', '1'))
+    return Progress(name, unit, total, output, interval)
+
+def track(iterable, name, unit='items', total=None):
+    """
+    Count the items of an iterable as they are consumed.
+
+    While telemetry is disabled the iterable itself is returned.
+    """
+    if not enabled():
+        return iterable
+    if total is None and hasattr(iterable, '__len__'):
+        total = len(iterable)
+    return _track(iterable, progress(name, unit, total))
+
+def _track(iterable, tracker):
+    with tracker:
+        for item in iterable:
+            yield item
+            tracker.add()
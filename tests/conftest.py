@@ -0,0 +1,31 @@
+import os
+import time
+
+import pytest
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--time-budget-scale", type=float,
+        default=float(os.environ.get("AOC_TIME_BUDGET_SCALE", "1")),
+        help="Multiply every per-part time budget by this factor; 0 disables budgets "
+             "(default: $AOC_TIME_BUDGET_SCALE or 1)",
+    )
+
+@pytest.fixture
+def within_budget(request):
+    """
+    Call a function and fail if it takes longer than its time budget.
+
+    Usage: within_budget(seconds, func, *args) returns func(*args).
+    """
+    scale = request.config.getoption("--time-budget-scale")
+
+    def run(seconds, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        if scale and elapsed > seconds * scale:
+            pytest.fail(f"{func.__qualname__} took {elapsed:.3f}s, budget is {seconds * scale:.3f}s")
+        return result
+
+    return run
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import run_all_days
+from src import answer_cache, loader
+from src.answer_cache import AnswerCache
+
+def age(cache, key, mtime):
+    os.utime(cache._path(key), (mtime, mtime))
+
+def stored_keys(cache):
+    return sorted(path.stem for path in cache.directory.glob('*.json'))
+
+def test_put_evicts_the_oldest_entries_past_max_entries(tmp_path):
+    cache = AnswerCache(tmp_path, max_entries=2)
+    cache.put('a', 1)
+    age(cache, 'a', 1000)
+    cache.put('b', 2)
+    age(cache, 'b', 2000)
+    cache.put('c', 3)
+    assert stored_keys(cache) == ['b', 'c']
+    assert cache.get('a') == (False, None)
+    assert cache.get('c') == (True, 3)
+
+def test_put_evicts_the_oldest_entries_past_max_bytes(tmp_path):
+    cache = AnswerCache(tmp_path)
+    cache.put('a', 'x' * 100)
+    age(cache, 'a', 1000)
+    cache.put('b', 'x' * 100)
+    age(cache, 'b', 2000)
+    cache.max_bytes = cache._path('a').stat().st_size + cache._path('b').stat().st_size
+    cache.put('c', 'x' * 100)
+    assert stored_keys(cache) == ['b', 'c']
+
+def test_a_hit_refreshes_recency(tmp_path):
+    cache = AnswerCache(tmp_path, max_entries=2)
+    cache.put('a', 1)
+    age(cache, 'a', 1000)
+    cache.put('b', 2)
+    age(cache, 'b', 2000)
+    assert cache.get('a') == (True, 1)
+    cache.put('c', 3)
+    assert stored_keys(cache) == ['a', 'c']
+
+def test_unserializable_answers_are_skipped(tmp_path):
+    cache = AnswerCache(tmp_path)
+    cache.put('a', {1, 2})
+    assert cache.get('a') == (False, None)
+    assert list(tmp_path.iterdir()) == []
+
+def test_no_cache_bypasses_the_answer_store(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(answer_cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(loader, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(sys, 'path', list(sys.path))
+    monkeypatch.setenv('AOC_NO_CACHE', '0')
+    answers = tmp_path / 'answers'
+
+    run_all_days.run_day(1, use_cache=False)
+    assert not answers.exists()
+    uncached = capsys.readouterr().out
+    run_all_days.main(['--no-cache', '1'])
+    assert not answers.exists()
+    assert capsys.readouterr().out == uncached
+
+    run_all_days.run_day(1)
+    assert len(list(answers.glob('*.json'))) == 2
+    assert capsys.readouterr().out == uncached
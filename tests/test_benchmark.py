@@ -0,0 +1,42 @@
+from src.benchmark import PHASES, compare_to_baseline, measure_memory
+
+def test_measure_memory_reports_peak_and_what_is_left():
+    kept = measure_memory(lambda n: [0] * n, (100000,))
+    assert kept['peak_bytes'] >= 800000
+    assert kept['net_bytes'] >= 800000
+    freed = measure_memory(lambda n: len(bytearray(n)), (1000000,))
+    assert freed['peak_bytes'] >= 1000000
+    assert freed['net_bytes'] < 1000
+
+def bench_entry(median, peak_bytes=None):
+    stats = {'median': median, 'p95': median}
+    if peak_bytes is not None:
+        stats['peak_bytes'] = peak_bytes
+    return {phase: dict(stats) for phase in PHASES}
+
+def test_compare_to_baseline_flags_slower_and_larger_phases():
+    baseline = {'days': {'1': bench_entry(0.010, 1 << 20), '2': bench_entry(0.010)}}
+    results = {'days': {'1': bench_entry(0.020, 4 << 20), '2': bench_entry(0.0105)}}
+    regressions = compare_to_baseline(results, baseline)
+    assert len(regressions) == 2 * len(PHASES)
+    assert all(regression.startswith("Day 1 ") for regression in regressions)
+    assert sum('peak memory' in regression for regression in regressions) == len(PHASES)
+
+def test_compare_to_baseline_ignores_sub_millisecond_noise():
+    baseline = {'days': {'1': bench_entry(0.0001, 1000)}}
+    results = {'days': {'1': bench_entry(0.0005, 5000)}}
+    assert compare_to_baseline(results, baseline) == []
+
+def test_compare_to_baseline_flags_failing_and_missing_days():
+    baseline = {'days': {'1': bench_entry(0.010), '2': bench_entry(0.010),
+                         '3': bench_entry(0.010), '4': {'error': 'ValueError: old'}}}
+    results = {'days': {'1': {'error': 'ValueError: boom'}, '4': {'error': 'ValueError: still'}}}
+    assert compare_to_baseline(results, baseline) == [
+        "Day 1: ValueError: boom",
+        "Day 2: missing from the results",
+        "Day 3: missing from the results",
+    ]
+    assert compare_to_baseline(results, baseline, days=[1, 2]) == [
+        "Day 1: ValueError: boom",
+        "Day 2: missing from the results",
+    ]
@@ -0,0 +1,340 @@
+import importlib
+import random
+from functools import lru_cache
+
+import pytest
+
+from src.loader import day_input_path, iter_lines
+
+# Correct answers for the shipped input.txt files: (day, part) -> (answer, time budget in seconds)
+SHIPPED_ANSWERS = {
+    (1, 1): (1580061, 0.5),
+    (1, 2): (23046913, 0.5),
+    (2, 1): (670, 0.5),
+    (2, 2): (700, 0.5),
+    (3, 1): (188741603, 0.5),
+    (3, 2): (67269798, 0.5),
+    (4, 1): (2591, 1.0),
+    (4, 2): (1880, 1.0),
+    (5, 1): (3608, 0.5),
+    (5, 2): (4922, 0.5),
+    (6, 1): (5312, 0.5),
+    (6, 2): (1748, 1.0),
+    (7, 1): (8401132154762, 0.5),
+    (7, 2): (95297119227552, 0.5),
+    (8, 1): (291, 0.5),
+    (9, 1): (6378826667552, 2.0),
+}
+
+# Hand-written examples from the puzzle statements: day -> (input text, part 1, part 2)
+EXAMPLES = {
+    1: ("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n", 11, 31),
+    2: ("7 6 4 2 1\n1 2 7 8 9\n9 7 6 2 1\n1 3 2 4 5\n8 6 4 4 1\n1 3 6 7 9\n", 2, 4),
+    3: ("xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))\n", 161, 48),
+    4: ("MMMSXXMASM\nMSAMXMSMSA\nAMXSXMAAMM\nMSAMASMSMX\nXMASAMXAMM\n"
+        "XXAMMXXAMA\nSMSMSASXSS\nSAXAMASAAA\nMAMMMXMMMM\nMXMXAXMASX\n", 18, 9),
+    5: ("47|53\n97|13\n97|61\n97|47\n75|29\n61|13\n75|53\n29|13\n97|29\n53|29\n61|53\n"
+        "97|53\n61|29\n47|13\n75|47\n97|75\n47|61\n75|61\n47|29\n75|13\n53|13\n\n"
+        "75,47,61,53,29\n97,61,53,29,13\n75,29,13\n75,97,47,61,53\n61,13,29\n97,13,75,29,47\n",
+        143, 123),
+    6: ("....#.....\n.........#\n..........\n..#.......\n.......#..\n"
+        "..........\n.#..^.....\n........#.\n#.........\n......#...\n", 41, 6),
+    7: ("190: 10 19\n3267: 81 40 27\n83: 17 5\n156: 15 6\n7290: 6 8 6 15\n"
+        "161011: 16 10 13\n192: 17 8 14\n21037: 9 7 18 13\n292: 11 6 16 20\n", 3749, 11387),
+    8: ("............\n........0...\n.....0......\n.......0....\n....0.......\n......A.....\n"
+        "............\n............\n........A...\n.........A..\n............\n............\n",
+        14, None),
+    9: ("2333133121414131402\n", 1928, None),
+}
+
+# Parts whose current implementation is known to disagree with the puzzle answer
+KNOWN_BUGS = {
+    (7, 1): "part 1 also tries the concatenation operator",
+    (8, 1): "antennas with frequency '0' are ignored",
+    (9, 1): "the disk map is read as file lengths only, without free space",
+}
+
+def load_day(day):
+    return importlib.import_module(f"src.day_{day:02d}.day_{day:02d}")
+
+@lru_cache(maxsize=None)
+def shipped_input(day):
+    day_module = load_day(day)
+    return day_module.parse_input(day_input_path(day_module.__file__))
+
+def cases(answers, bugs):
+    """Build pytest params, marking known bugs as strict expected failures."""
+    params = []
+    for (day, part), values in answers:
+        marks = []
+        if (day, part) in bugs:
+            marks.append(pytest.mark.xfail(reason=bugs[(day, part)], strict=True))
+        params.append(pytest.param(day, part, *values, marks=marks, id=f"day{day:02d}-part{part}"))
+    return params
+
+@pytest.mark.parametrize(
+    "day, part, expected, budget",
+    cases(SHIPPED_ANSWERS.items(), KNOWN_BUGS),
+)
+def test_shipped_input(day, part, expected, budget, within_budget):
+    solve = getattr(load_day(day), f"part{part}")
+    assert within_budget(budget, solve, shipped_input(day)) == expected
+
+@pytest.mark.parametrize(
+    "day, part, expected",
+    cases(
+        (((day, part), (answers[part],)) for day, answers in EXAMPLES.items()
+         for part in (1, 2) if answers[part] is not None),
+        KNOWN_BUGS,
+    ),
+)
+def test_example(day, part, expected, tmp_path, within_budget):
+    day_module = load_day(day)
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(EXAMPLES[day][0])
+    solve = getattr(day_module, f"part{part}")
+    assert within_budget(0.5, solve, day_module.parse_input(input_path)) == expected
+
+@pytest.mark.parametrize("day", [1, 2, 5, 7])
+def test_solve_stream_matches_parts(day, tmp_path):
+    day_module = load_day(day)
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(EXAMPLES[day][0])
+    input_data = day_module.parse_input(input_path)
+    expected = (day_module.part1(input_data), day_module.part2(input_data))
+    assert day_module.solve_stream(iter_lines(input_path)) == expected
+
+def test_day01_numpy_engine_matches(tmp_path):
+    pytest.importorskip("numpy")
+    day_module = load_day(1)
+    for text in (EXAMPLES[1][0], day_input_path(day_module.__file__).read_text()):
+        input_path = tmp_path / "input.txt"
+        input_path.write_text(text)
+        input_data = day_module.parse_input(input_path)
+        arrays = day_module.parse_input_np(input_path)
+        assert day_module.part1_np(arrays) == day_module.part1(input_data)
+        assert day_module.part2_np(arrays) == day_module.part2(input_data)
+
+def test_day01_location_lists_track_both_answers():
+    day_module = load_day(1)
+    rng = random.Random(1)
+    lists = day_module.LocationLists(block_size=4)
+    left, right = [], []
+    for _ in range(300):
+        if left and rng.random() < 0.3:
+            pair = rng.choice(left), rng.choice(right)
+            left.remove(pair[0])
+            right.remove(pair[1])
+            lists.remove(*pair)
+        else:
+            pair = rng.randint(0, 40), rng.randint(0, 40)
+            left.append(pair[0])
+            right.append(pair[1])
+            lists.insert(*pair)
+        assert lists.distance == day_module.part1((left, right))
+        assert lists.similarity == day_module.part2((left, right))
+
+def test_day01_location_lists_with_widely_spread_ids():
+    day_module = load_day(1)
+    rng = random.Random(13)
+    lists = day_module.LocationLists(block_size=8)
+    left, right = [], []
+    for _ in range(400):
+        if left and rng.random() < 0.3:
+            pair = rng.choice(left), rng.choice(right)
+            left.remove(pair[0])
+            right.remove(pair[1])
+            lists.remove(*pair)
+        else:
+            pair = rng.randint(-10 ** 12, 10 ** 12), rng.choice((rng.randint(0, 9), 10 ** 15))
+            left.append(pair[0])
+            right.append(pair[1])
+            lists.insert(*pair)
+        assert lists.distance == day_module.part1((left, right))
+        assert lists.similarity == day_module.part2((left, right))
+    # Storage follows the distinct ids present, not the range they span
+    assert sum(len(block.ids) for block in lists._blocks) == len(set(left) | set(right))
+
+def test_day01_location_lists_on_shipped_input():
+    lists = load_day(1).LocationLists(zip(*shipped_input(1)))
+    assert (lists.distance, lists.similarity) == (1580061, 23046913)
+    lists.insert(10 ** 7, 0)
+    lists.remove(10 ** 7, 0)
+    assert (lists.distance, lists.similarity) == (1580061, 23046913)
+
+def brute_force_dampener(day_module, report):
+    return any(day_module.is_safe_report(report[:i] + report[i + 1:]) for i in range(len(report)))
+
+def test_day02_linear_dampener_matches_brute_force():
+    day_module = load_day(2)
+    rng = random.Random(2)
+    for _ in range(5000):
+        report = [rng.randint(0, 10) for _ in range(rng.randint(0, 8))]
+        expected = day_module.is_safe_report(report) or brute_force_dampener(day_module, report)
+        assert day_module.is_safe_with_problem_dampener(report) == expected, report
+
+def test_day02_batch_counts_match():
+    pytest.importorskip("numpy")
+    day_module = load_day(2)
+    rng = random.Random(3)
+    reports = [[rng.randint(0, 10) for _ in range(rng.randint(0, 8))] for _ in range(5000)]
+    reports += shipped_input(2)
+    expected = (day_module.part1(reports), day_module.part2(reports))
+    assert day_module.count_safe_batch(reports) == expected
+
+def test_day03_conditional_scan_edge_cases():
+    day_module = load_day(3)
+    memory = "mul(mul(2,3)don't()mul(4,5)do_mul(9,9)do()mul(1000,2)mul(7,8)don't(mul(1,1)"
+    assert day_module.find_valid_multiplications(memory) == [6, 20, 81, 56, 1]
+    assert day_module.find_valid_multiplications(memory, handle_conditionals=True) == [6, 56, 1]
+
+def test_day03_chunked_file_scan_matches_parts(tmp_path):
+    from src.input_generators import write_input
+
+    day_module = load_day(3)
+    for input_path in (write_input(3, 2, tmp_path), day_input_path(day_module.__file__)):
+        memory = day_module.parse_input(input_path)
+        expected = (day_module.part1(memory), day_module.part2(memory))
+        # Chunk sizes around the longest instruction make matches straddle boundaries
+        for chunk_size in (1, 7, 12, 13, 4096):
+            assert day_module.solve_file(input_path, chunk_size, jobs=1) == expected
+        assert day_module.solve_file(input_path, 4096, jobs=2) == expected
+
+def test_day04_numpy_engine_matches():
+    pytest.importorskip("numpy")
+    from src.grid import Grid
+
+    day_module = load_day(4)
+    rng = random.Random(4)
+    grids = [shipped_input(4)]
+    for _ in range(200):
+        width, height = rng.randint(1, 9), rng.randint(1, 9)
+        grids.append(Grid.from_lines(''.join(rng.choice('XMAS') for _ in range(width))
+                                     for _ in range(height)))
+    for grid in grids:
+        assert day_module.part1_np(grid) == day_module.part1(grid)
+        assert day_module.part2_np(grid) == day_module.part2(grid)
+    array = day_module.grid_array(Grid.from_lines(["ABCBA", "BABAB", "CBABC"]))
+    assert day_module.count_word_np(array, "ABC") == 7
+    array = day_module.grid_array(Grid.from_lines(["ABABA", "BBBBB", "ABABA"]))
+    assert day_module.count_x_np(array, "ABA") == 2
+
+def test_day04_automaton_counts_many_words():
+    pytest.importorskip("numpy")
+    from src.grid import Grid
+
+    day_module = load_day(4)
+    grid = shipped_input(4)
+    assert day_module.count_words(grid, ["XMAS"]) == {"XMAS": day_module.find_xmas(grid)}
+    rng = random.Random(5)
+    for _ in range(100):
+        width, height = rng.randint(1, 9), rng.randint(1, 9)
+        grid = Grid.from_lines(''.join(rng.choice('XMAS') for _ in range(width))
+                               for _ in range(height))
+        words = [''.join(rng.choice('XMAS') for _ in range(rng.randint(1, 5))) for _ in range(20)]
+        array = day_module.grid_array(grid)
+        counts = day_module.count_words(grid, words)
+        assert counts == {word: day_module.count_word_np(array, word) for word in words}
+
+def test_day05_rule_index_matches_original_checks():
+    from collections import defaultdict
+
+    day_module = load_day(5)
+    rng = random.Random(6)
+    for _ in range(500):
+        order = rng.sample(range(10, 40), 12)
+        total = defaultdict(set)
+        partial = defaultdict(set)
+        for i, before in enumerate(order):
+            for after in order[i + 1:]:
+                total[before].add(after)
+                if rng.random() < 0.5:
+                    partial[before].add(after)
+        update = rng.sample(order + [97, 98], rng.randint(1, 9))
+        assert day_module.RuleIndex(partial).is_valid(update) == day_module.is_valid_order(update, partial)
+        update = [page for page in update if page in order]
+        index = day_module.RuleIndex(total)
+        assert index.is_valid(update) == day_module.is_valid_order(update, total)
+        assert index.order(update) == day_module.topological_sort(update, total)
+        if update:
+            assert index.middle_page(update) == day_module.get_middle_page(index.order(update))
+    rules, updates = shipped_input(5)
+    assert day_module.RuleIndex(rules).middle_sums(iter(updates)) == (3608, 4922)
+
+def test_day05_middle_page_needs_a_total_order():
+    index = load_day(5).RuleIndex({1: {2}, 3: {4}})
+    with pytest.raises(ValueError):
+        index.middle_page([1, 2, 3, 4])
+
+def brute_force_visited(lines, start):
+    """Count the cells the guard visits by walking one cell at a time, facing up at first."""
+    height, width = len(lines), len(lines[0])
+    (x, y), (dx, dy) = start, (0, -1)
+    visited = {(x, y)}
+    while True:
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < width and 0 <= ny < height):
+            return len(visited)
+        if lines[ny][nx] == '#':
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+            visited.add((x, y))
+
+def brute_force_loops(lines, start):
+    """Count loop positions by walking the whole route for every empty cell."""
+    height, width = len(lines), len(lines[0])
+    count = 0
+    for y in range(height):
+        for x in range(width):
+            if lines[y][x] != '.':
+                continue
+            (gx, gy), (dx, dy), seen = start, (0, -1), set()
+            while (gx, gy, dx, dy) not in seen:
+                seen.add((gx, gy, dx, dy))
+                nx, ny = gx + dx, gy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    break
+                if lines[ny][nx] == '#' or (nx, ny) == (x, y):
+                    dx, dy = -dy, dx
+                else:
+                    gx, gy = nx, ny
+            else:
+                count += 1
+    return count
+
+def test_day06_loop_positions_match_brute_force(tmp_path):
+    from src.input_generators import GENERATORS
+
+    day_module = load_day(6)
+    for seed in range(8):
+        input_path = tmp_path / "input.txt"
+        input_path.write_text(GENERATORS[6](random.Random(seed), 0.15))
+        grid, start_pos, start_dir = day_module.parse_input(input_path)
+        positions = day_module.find_loop_positions(grid, start_pos, start_dir)
+        assert len(positions) == brute_force_loops(grid.lines(), start_pos)
+        visited = brute_force_visited(grid.lines(), start_pos)
+        assert day_module.count_visited(grid, start_pos, start_dir) == visited
+
+def test_day06_parallel_loop_search_matches_serial():
+    day_module = load_day(6)
+    grid, start_pos, start_dir = shipped_input(6)
+    serial = day_module.find_loop_positions(grid, start_pos, start_dir)
+    assert day_module.find_loop_positions(grid, start_pos, start_dir, jobs=2) == serial
+
+def test_day07_pruned_solver_matches_brute_force():
+    from itertools import product
+
+    day_module = load_day(7)
+    rng = random.Random(7)
+    for _ in range(3000):
+        numbers = [rng.randint(0, 12) for _ in range(rng.randint(1, 5))]
+        operators = rng.choice((('+', '*', '||'), ('+', '*')))
+        if rng.random() < 0.5:
+            test_value = day_module.evaluate_equation(numbers, [rng.choice(operators) for _ in numbers[1:]])
+        else:
+            test_value = rng.randint(0, 2000)
+        expected = any(day_module.evaluate_equation(numbers, ops) == test_value
+                       for ops in product(operators, repeat=len(numbers) - 1))
+        concatenation = len(operators) == 3
+        assert day_module.is_equation_possible(test_value, numbers, concatenation) == expected
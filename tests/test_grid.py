@@ -0,0 +1,35 @@
+import pytest
+
+from src.grid import BORDER, Grid
+
+def test_from_lines_round_trip():
+    grid = Grid.from_lines(["ab.\n", "c#d\n", "\n"])
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid.lines() == ["ab.", "c#d"]
+    assert grid.get(1, 1) == "#"
+    assert grid.get(3, 0) is None
+
+def test_index_coords_and_border():
+    grid = Grid.from_lines(["abc", "def"])
+    for y in range(grid.height):
+        for x in range(grid.width):
+            assert grid.coords(grid.index(x, y)) == (x, y)
+    assert [chr(grid[i]) for i in grid.indices()] == list("abcdef")
+    # One step off any edge, in any direction, reads the sentinel
+    for index in grid.indices():
+        for step in grid.offsets8:
+            x, y = grid.coords(index + step)
+            if not grid.contains(x, y):
+                assert grid[index + step] == BORDER
+
+def test_overlay_is_copy_on_write():
+    grid = Grid.from_lines(["...", "..."])
+    index = grid.index(1, 1)
+    overlay = grid.overlay({index: ord("O")})
+    assert overlay[index] == ord("O")
+    assert grid[index] == ord(".")
+    assert overlay.materialize().lines() == ["...", ".O."]
+
+def test_ragged_rows_are_rejected():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["abc", "de"])
@@ -0,0 +1,39 @@
+import importlib
+import sys
+
+from src import loader
+
+DAY_SOURCE = '''from src.loader_test_helper import parse_lines
+
+def parse_input(input_path):
+    with open(input_path) as file:
+        return parse_lines(file)
+'''
+
+def write_helper(directory, body):
+    (directory / "loader_test_helper.py").write_text(f"def parse_lines(lines):\n    return {body}\n")
+
+def test_editing_a_parse_helper_invalidates_the_cache(tmp_path, monkeypatch):
+    package = tmp_path / "src"
+    package.mkdir()
+    (package / "input.txt").write_text("a b\nc d\n")
+    (package / "loader_test_day.py").write_text(DAY_SOURCE)
+    write_helper(package, "[line.split() for line in lines]")
+    # src is a namespace package, so it picks up modules from every src/ on sys.path
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(loader, "CACHE_DIR", tmp_path / "cache")
+    day = importlib.import_module("src.loader_test_day")
+    try:
+        assert loader.load_input(day.__file__, day.parse_input) == [["a", "b"], ["c", "d"]]
+        first_key = loader.parse_cache_path(package / "input.txt", day.parse_input)
+        assert first_key.exists()
+
+        # Only the helper changes; the day module and its parse_input stay the same
+        write_helper(package, "[line.split()[:1] for line in lines]")
+        importlib.reload(importlib.import_module("src.loader_test_helper"))
+        day = importlib.reload(day)
+        assert loader.parse_cache_path(package / "input.txt", day.parse_input) != first_key
+        assert loader.load_input(day.__file__, day.parse_input) == [["a"], ["c"]]
+    finally:
+        monkeypatch.delitem(sys.modules, "src.loader_test_day", raising=False)
+        monkeypatch.delitem(sys.modules, "src.loader_test_helper", raising=False)
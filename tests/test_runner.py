@@ -0,0 +1,39 @@
+import contextlib
+import io
+import multiprocessing
+import os
+
+import pytest
+
+import run_all_days
+
+def test_parallel_output_matches_serial(capsys):
+    serial = io.StringIO()
+    with contextlib.redirect_stdout(serial):
+        for day in (1, 3):
+            run_all_days.run_day(day, use_cache=False)
+    outputs = run_all_days.run_days_parallel([1, 3], jobs=2, use_cache=False)
+    assert outputs[1] + outputs[3] == serial.getvalue()
+    assert capsys.readouterr().out == serial.getvalue()
+
+def crash(day_number, use_cache=True):
+    os._exit(3)
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="workers only see the patched run_day when forked")
+def test_crashed_worker_keeps_the_day_header(monkeypatch, capsys):
+    monkeypatch.setattr(run_all_days, "run_day", crash)
+    outputs = run_all_days.run_days_parallel([2], jobs=1)
+    assert outputs[2] == f"{run_all_days._day_header(2)}Error running Day 2: worker exited with code 3\n"
+
+def test_streaming_day_3_needs_a_named_file(capsys):
+    assert run_all_days.run_stream(3, '-') == 1
+    assert capsys.readouterr().out == "Day 3 needs --input FILE (mmap scan)\n"
+
+def test_main_runs_repeated_days_once_and_times_out_without_jobs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(run_all_days, "run_days_parallel",
+                        lambda days, jobs, timeout, use_cache: calls.append((days, jobs, timeout)))
+    monkeypatch.setattr(run_all_days.sys, "path", list(run_all_days.sys.path))
+    assert run_all_days.main(["3", "1", "3", "--timeout", "5"]) == 0
+    assert calls == [([3, 1], 1, 5.0)]
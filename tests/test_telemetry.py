@@ -0,0 +1,33 @@
+import io
+import json
+
+import pytest
+
+from src import telemetry
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("AOC_TELEMETRY", raising=False)
+    items = [1, 2, 3]
+    assert telemetry.track(items, "test") is items
+    assert telemetry.progress("test") is telemetry.NULL_PROGRESS
+
+def test_track_reports_final_count_as_json(monkeypatch, capsys):
+    monkeypatch.setenv("AOC_TELEMETRY", "json")
+    assert sum(telemetry.track(range(1000), "test", "cells")) == 499500
+    record = json.loads(capsys.readouterr().err.splitlines()[-1])
+    assert record["name"] == "test"
+    assert (record["count"], record["total"], record["unit"], record["done"]) == (1000, 1000, "cells", True)
+
+def test_reports_are_rate_limited():
+    stream = io.StringIO()
+    with telemetry.Progress("test", interval=3600, stream=stream) as tracker:
+        for _ in range(100000):
+            tracker.add()
+    # Only the final report, since the interval never elapsed
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1 and lines[0].startswith("[test] 100000 items")
+
+def test_rejects_unknown_output(monkeypatch):
+    monkeypatch.setenv("AOC_TELEMETRY", "xml")
+    with pytest.raises(ValueError):
+        telemetry.enabled()